@@ -0,0 +1,170 @@
+"""
+卡池统计的 NumPy 实现与逐个循环的比较
+
+    python -m benchmarks.bench_analytics
+    python -m benchmarks.bench_analytics --copies 50 --variants 20
+
+variants 为计算复刻间隔时使用的不同 now (模拟多个假设时间点), 每个时间点都重新计算
+全部统计; 计时包含从卡池列表转换为数组的时间.
+"""
+
+import argparse
+import math
+import time
+from typing import Any
+
+import numpy as np
+
+from benchmarks.bench_query import scale
+from waves_pool_list.analytics import (
+    DAY,
+    PoolArrays,
+    banner_overlap,
+    four_star_frequency,
+    rerun_stats,
+)
+from waves_pool_list.storage import load_pool_list
+from waves_pool_list.timeline import pool_intervals
+
+
+def reference_rerun_stats(pool_list: list[dict[str, Any]], now: int) -> dict:
+    appearances: dict[str, set[tuple[int, int]]] = {}
+    for pool, (start, end) in zip(pool_list, pool_intervals(pool_list)):
+        for item_id in pool["five_star_ids"]:
+            appearances.setdefault(item_id, set()).add((start, end))
+    result = {}
+    for item_id, intervals in appearances.items():
+        intervals = sorted(intervals)
+        # 同一开始时间只算一次, 保留结束时间最早的一个
+        distinct = [intervals[0]]
+        for interval in intervals[1:]:
+            if interval[0] != distinct[-1][0]:
+                distinct.append(interval)
+        gaps = [
+            (start - prev_end) / DAY
+            for (_, prev_end), (start, _) in zip(distinct, distinct[1:])
+        ]
+        last_end = max(end for _, end in distinct)
+        result[item_id] = (
+            len(distinct),
+            sum(gaps) / len(gaps) if gaps else math.nan,
+            min(gaps, default=math.nan),
+            max(gaps, default=math.nan),
+            (now - last_end) / DAY,
+        )
+    return result
+
+
+def reference_four_star_frequency(pool_list: list[dict[str, Any]]) -> dict:
+    result: dict[str, list[int]] = {}
+    for pool in pool_list:
+        for item_id in pool["four_star_ids"]:
+            counts = result.setdefault(item_id, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += pool["pool_type"] == "角色活动唤取"
+            counts[2] += pool["pool_type"] == "武器活动唤取"
+    return result
+
+
+def reference_banner_overlap(pool_list: list[dict[str, Any]]) -> list:
+    intervals = pool_intervals(pool_list)
+    pools = list(zip(pool_list, intervals))
+    result = []
+    for i, (c_pool, (c_start, c_end)) in enumerate(pools):
+        if c_pool["pool_type"] != "角色活动唤取":
+            continue
+        for j, (w_pool, (w_start, w_end)) in enumerate(pools):
+            if w_pool["pool_type"] != "武器活动唤取":
+                continue
+            overlap = min(c_end, w_end) - max(c_start, w_start)
+            if overlap > 0:
+                result.append((i, j, overlap / DAY))
+    return result
+
+
+def reference(pool_list: list[dict[str, Any]], nows: list[int]):
+    for now in nows:
+        reference_rerun_stats(pool_list, now)
+    reference_four_star_frequency(pool_list)
+    reference_banner_overlap(pool_list)
+
+
+def vectorized(pool_list: list[dict[str, Any]], nows: list[int]):
+    arrays = PoolArrays.from_pool_list(pool_list)
+    for now in nows:
+        rerun_stats(arrays, now)
+    four_star_frequency(arrays)
+    banner_overlap(arrays)
+
+
+def check(pool_list: list[dict[str, Any]], now: int):
+    arrays = PoolArrays.from_pool_list(pool_list)
+    stats = rerun_stats(arrays, now)
+    expected = reference_rerun_stats(pool_list, now)
+    assert sorted(stats["id"].tolist()) == sorted(expected)
+    actual = np.column_stack(
+        [
+            stats["appearances"],
+            stats["gap_mean"],
+            stats["gap_min"],
+            stats["gap_max"],
+            stats["days_since_last"],
+        ]
+    )
+    wanted = np.array([expected[item_id] for item_id in stats["id"].tolist()])
+    assert np.allclose(actual, wanted, equal_nan=True)
+
+    frequency = four_star_frequency(arrays)
+    expected = reference_four_star_frequency(pool_list)
+    for row, item_id in enumerate(frequency["id"].tolist()):
+        assert expected[item_id] == [
+            frequency["count"][row],
+            frequency["character_count"][row],
+            frequency["weapon_count"][row],
+        ], item_id
+
+    overlap = banner_overlap(arrays)
+    actual = sorted(
+        zip(
+            overlap["character_pool"].tolist(),
+            overlap["weapon_pool"].tolist(),
+            overlap["overlap"].tolist(),
+        )
+    )
+    assert actual == sorted(reference_banner_overlap(pool_list))
+
+
+def bench(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--variants", type=int, default=10)
+    args = parser.parse_args()
+
+    pool_list = scale(load_pool_list(), args.copies)
+    intervals = pool_intervals(pool_list)
+    lo = min(start for start, _ in intervals)
+    hi = max(end for _, end in intervals)
+    nows = np.linspace(lo, hi, args.variants, dtype=np.int64).tolist()
+    check(pool_list, nows[-1])
+
+    reference_time = bench(reference, pool_list, nows)
+    vectorized_time = bench(vectorized, pool_list, nows)
+    print(f"卡池: {len(pool_list)}, 时间点: {len(nows)}")
+    print(
+        f"循环 {reference_time * 1000:>9.1f} ms"
+        f"  NumPy {vectorized_time * 1000:>9.1f} ms"
+        f"  {reference_time / vectorized_time:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+多语言名称表与原来每种语言各自构建 char_list / weapon_list 和字典的比较
+
+    python -m benchmarks.bench_catalog
+    python -m benchmarks.bench_catalog --items 2000
+    python -m benchmarks.bench_catalog --real  # 使用 hakush 的真实数据 (需要网络或缓存)
+
+默认使用生成的数据: 8 种语言, 繁体中文和日文的部分名称与简体中文相同,
+各欧洲语言的部分名称与英文相同. 内存为构建后仍然占用的字节数 (tracemalloc).
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any
+
+from waves_pool_list.catalog import (
+    Character,
+    Weapon,
+    fetch_character_data,
+    fetch_weapon_data,
+)
+from waves_pool_list.names import LOCALES, NameTable
+
+
+def random_name(rng: random.Random, alphabet: str, length: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def generate(items: int, seed: int = 0) -> tuple[dict, dict]:
+    rng = random.Random(seed)
+    cjk = [chr(code) for code in range(0x4E00, 0x4E00 + 3000)]
+    hangul = [chr(code) for code in range(0xAC00, 0xAC00 + 2000)]
+    latin = "abcdefghijklmnopqrstuvwxyz"
+
+    def names() -> dict[str, str]:
+        zh = random_name(rng, cjk, rng.randint(2, 4))
+        en = random_name(rng, latin, rng.randint(4, 12)).title()
+        return {
+            "zh-Hans": zh,
+            "zh-Hant": zh if rng.random() < 0.7 else random_name(rng, cjk, len(zh)),
+            "en": en,
+            "ja": zh if rng.random() < 0.5 else random_name(rng, cjk, 4),
+            "ko": random_name(rng, hangul, rng.randint(2, 4)),
+            **{
+                locale: en if rng.random() < 0.8 else en + random_name(rng, latin, 3)
+                for locale in ("fr", "de", "es")
+            },
+        }
+
+    characters = {
+        str(1000 + i): {**names(), "element": rng.randint(1, 6), "icon": "..."}
+        for i in range(items // 3)
+    }
+    weapons = {
+        str(21000000 + i): {**names(), "rank": rng.randint(1, 5), "icon": "..."}
+        for i in range(items - items // 3)
+    }
+    return characters, weapons
+
+
+def legacy_build(
+    raw_character_data: dict[str, Any],
+    raw_weapon_data: dict[str, Any],
+    locales: tuple[str, ...],
+) -> dict[str, tuple]:
+    """原来的做法: 每种语言逐个 model_validate, 再构建 6 个字典"""
+    result = {}
+    for locale in locales:
+        char_list = [
+            Character.model_validate(
+                {"char_id": i, "char_name": d[locale], "star": d["element"]}
+            )
+            for i, d in raw_character_data.items()
+            if locale in d
+        ]
+        weapon_list = [
+            Weapon.model_validate(
+                {"weapon_id": i, "weapon_name": d[locale], "star": d["rank"]}
+            )
+            for i, d in raw_weapon_data.items()
+            if locale in d
+        ]
+        id2char_name = {c.char_id: c.char_name for c in char_list}
+        name2char_id = {c.char_name: c.char_id for c in char_list}
+        id2weapon_name = {w.weapon_id: w.weapon_name for w in weapon_list}
+        name2weapon_id = {w.weapon_name: w.weapon_id for w in weapon_list}
+        result[locale] = (
+            char_list,
+            weapon_list,
+            id2char_name,
+            name2char_id,
+            id2weapon_name,
+            name2weapon_id,
+            {**id2char_name, **id2weapon_name},
+            {**name2char_id, **name2weapon_id},
+        )
+    return result
+
+
+def measure(build, raw: bytes) -> tuple[float, int, Any]:
+    """构建时间 (取 5 次中最快的一次) 和构建后占用的内存, 原始 JSON 在计时内解析后释放"""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        build(*json.loads(raw))
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build(*json.loads(raw))
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return best, size, value
+
+
+def bench_lookup(func, keys: list, rounds: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            func(key)
+    return (time.perf_counter() - start) / (rounds * len(keys))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--real", action="store_true", help="使用 hakush 的真实数据")
+    args = parser.parse_args()
+
+    if args.real:
+        raw_data = (fetch_character_data(), fetch_weapon_data())
+    else:
+        raw_data = generate(args.items)
+    raw = json.dumps(raw_data, ensure_ascii=False).encode("utf-8")
+    locales = tuple(
+        locale
+        for locale in LOCALES
+        if any(locale in item for data in raw_data for item in data.values())
+    )
+
+    legacy_time, legacy_size, legacy = measure(
+        lambda c, w: legacy_build(c, w, locales), raw
+    )
+    table_time, table_size, table = measure(NameTable.from_raw, raw)
+    for locale in locales:
+        assert table.id2name(locale) == legacy[locale][6], locale
+        assert table.name2id(locale) == legacy[locale][7], locale
+
+    items = sum(len(data) for data in raw_data)
+    print(f"角色和武器: {items}, 语言: {len(locales)}")
+    print(
+        f"{'每种语言的列表和字典':<12} 构建 {legacy_time * 1000:>8.2f} ms"
+        f"  内存 {legacy_size / 1024:>9.1f} KiB"
+    )
+    print(
+        f"{'NameTable':<18} 构建 {table_time * 1000:>8.2f} ms"
+        f"  内存 {table_size / 1024:>9.1f} KiB"
+        f"  ({legacy_time / table_time:.1f}x, {legacy_size / table_size:.1f}x)"
+    )
+    print(f"NameTable.memory_usage(): {table.memory_usage()}")
+
+    rng = random.Random(0)
+    locale = locales[-1]
+    ids = rng.choices(list(legacy[locale][6]), k=1000)
+    names = rng.choices(list(legacy[locale][7]), k=1000)
+    cases = {
+        "id -> 名称": (
+            lambda item_id: legacy[locale][6][item_id],
+            lambda item_id: table.name(item_id, locale),
+            ids,
+        ),
+        "名称 -> id": (
+            lambda name: legacy[locale][7][name],
+            lambda name: table.id(name, locale),
+            names,
+        ),
+    }
+    for name, (legacy_lookup, table_lookup, keys) in cases.items():
+        print(
+            f"{name} ({locale})  字典 {bench_lookup(legacy_lookup, keys) * 1e9:>6.0f} ns"
+            f"  NameTable {bench_lookup(table_lookup, keys) * 1e9:>6.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+卡池公告解析的吞吐量
+
+    python -m benchmarks.bench_parser
+    python -m benchmarks.bench_parser --record  # 先录制真实公告
+"""
+
+import argparse
+import time
+
+from waves_pool_list.parser import parse_pool, parse_post_content, parse_title
+
+from .fixtures import load_catalog, load_posts, record
+
+
+def bench(func, rounds: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--record", action="store_true", help="先录制真实公告")
+    args = parser.parse_args()
+
+    if args.record:
+        record()
+    posts, source = load_posts()
+    catalog = load_catalog()
+    print(f"帖子: {len(posts)} ({source}), 轮数: {args.rounds}")
+
+    cases = {
+        "parse_title": lambda: [parse_title(post["postTitle"]) for post, _ in posts],
+        "parse_post_content": lambda: [
+            parse_post_content(detail["data"]["postDetail"]["postContent"], catalog)
+            for _, detail in posts
+        ],
+        "parse_pool": lambda: [
+            parse_pool(post, detail, catalog) for post, detail in posts
+        ],
+    }
+    for name, func in cases.items():
+        elapsed = bench(func, args.rounds)
+        rate = len(posts) * args.rounds / elapsed
+        print(f"{name:<20} {rate:>12,.0f} 帖子/秒")
+
+
+if __name__ == "__main__":
+    main()
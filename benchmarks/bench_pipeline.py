@@ -0,0 +1,109 @@
+"""
+离线的完整流程基准测试
+
+回放录制的 HTTP 请求 (可注入延迟), 分阶段统计耗时:
+角色武器数据、搜索翻页、帖子详情、解析、排序、写入,
+并比较顺序、并发和缓存三种模式
+
+    python -m benchmarks.bench_pipeline --latency 0.05
+    python -m benchmarks.bench_pipeline --record  # 先录制真实请求
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from waves_pool_list.cache import ResponseCache
+from waves_pool_list.catalog import get_catalog
+from waves_pool_list.client import create_session, set_cache, set_session
+from waves_pool_list.crawler import fetch_post_details, search_posts, sort_pool_list
+from waves_pool_list.fixed import FIXED_POOL_LIST
+from waves_pool_list.parser import parse_pool
+from waves_pool_list.replay import ReplayAdapter, use_adapter
+from waves_pool_list.storage import save_pool_list
+
+from .fixtures import KEYWORDS, get_fixtures, record
+
+STAGES = ("catalog", "search", "detail", "parse", "sort", "write")
+
+
+def run_pipeline(max_workers: int, end_page: int | None, output_path: Path):
+    timings = {}
+
+    @contextlib.contextmanager
+    def stage(name: str):
+        start = time.perf_counter()
+        yield
+        timings[name] = time.perf_counter() - start
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with stage("catalog"):
+            catalog = get_catalog(refresh=True)
+        with stage("search"):
+            posts = [post for kw in KEYWORDS for post in search_posts(kw, end_page)]
+        with stage("detail"):
+            post_ids = [post["postId"] for post in posts]
+            post_details = fetch_post_details(post_ids, max_workers)
+        with stage("parse"):
+            pool_list = [
+                parse_pool(post, post_detail, catalog)
+                for post, post_detail in zip(posts, post_details)
+            ]
+        with stage("sort"):
+            pool_list = sort_pool_list(FIXED_POOL_LIST + pool_list)
+        with stage("write"):
+            save_pool_list(
+                pool_list,
+                output_path / "pool.json",
+                output_path / "compressed_pool.json",
+                output_path / "manifest.json",
+                output_path / "changelog.jsonl",
+                shard_dir=output_path / "shards",
+            )
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.05, help="每个请求的延迟")
+    parser.add_argument("--jitter", type=float, default=0.02, help="随机延迟上限")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=None)
+    parser.add_argument("--record", action="store_true", help="先录制真实请求")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.pages)
+    fixtures, source = get_fixtures()
+    print(
+        f"请求: {len(fixtures)} ({source}), "
+        f"延迟: {args.latency}s + 0~{args.jitter}s"
+    )
+
+    modes = {
+        "sequential": (1, False),
+        "concurrent": (args.workers, False),
+        "cached": (args.workers, True),
+    }
+    print(f"{'mode':<12}" + "".join(f"{s:>10}" for s in STAGES) + f"{'total':>10}")
+    for mode, (max_workers, use_cache) in modes.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            session = create_session(max_workers)
+            use_adapter(session, ReplayAdapter(fixtures, args.latency, args.jitter))
+            set_session(session)
+            set_cache(ResponseCache(tmp_path / "cache", enabled=use_cache))
+            if use_cache:
+                # 先完整运行一次填充缓存
+                run_pipeline(max_workers, args.pages, tmp_path)
+            timings = run_pipeline(max_workers, args.pages, tmp_path)
+
+        row = "".join(f"{timings[s]:>10.3f}" for s in STAGES)
+        print(f"{mode:<12}{row}{sum(timings.values()):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+卡池时间线查询与逐个扫描的比较
+
+    python -m benchmarks.bench_query
+    python -m benchmarks.bench_query --copies 50  # 把卡池列表复制多份, 模拟更长的时间线
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from waves_pool_list.query import PoolIndex
+from waves_pool_list.storage import load_pool_list
+from waves_pool_list.timeline import pool_intervals, to_timestamp
+
+YEAR = 365 * 24 * 3600
+
+
+def scale(pool_list: list[dict[str, Any]], copies: int) -> list[dict[str, Any]]:
+    """把时间线整体平移后复制多份"""
+    intervals = pool_intervals(pool_list)
+    span = max(end for _, end in intervals) - min(start for start, _ in intervals)
+    shift = (span // YEAR + 1) * YEAR
+    result = []
+    for copy in range(copies):
+        for pool, (start, end) in zip(pool_list, intervals):
+            result.append(
+                {
+                    **pool,
+                    "start_timestamp": start + copy * shift,
+                    "end_timestamp": end + copy * shift,
+                }
+            )
+    return result
+
+
+class NaiveScan:
+    """每次查询都遍历整个列表"""
+
+    def __init__(self, pool_list: list[dict[str, Any]]):
+        self.pool_list = pool_list
+
+    def active_at(self, when) -> list[dict[str, Any]]:
+        when = to_timestamp(when)
+        return [
+            pool
+            for pool in self.pool_list
+            if pool["start_timestamp"] <= when <= pool["end_timestamp"]
+        ]
+
+    def overlapping(self, start, end) -> list[dict[str, Any]]:
+        start, end = to_timestamp(start), to_timestamp(end)
+        return [
+            pool
+            for pool in self.pool_list
+            if pool["start_timestamp"] <= end and start <= pool["end_timestamp"]
+        ]
+
+    def by_item(self, item_id: str) -> list[dict[str, Any]]:
+        return [
+            pool
+            for pool in self.pool_list
+            if item_id in pool["five_star_ids"] or item_id in pool["four_star_ids"]
+        ]
+
+
+def bench(func, queries: list) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        func(*query)
+    return time.perf_counter() - start
+
+
+def key(pool_list: list[dict[str, Any]]) -> list[tuple]:
+    return sorted(
+        (pool["bbs"], pool["start_timestamp"], pool["pool_type"]) for pool in pool_list
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--copies", type=int, default=1)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    pool_list = scale(load_pool_list(), args.copies)
+    start = time.perf_counter()
+    index = PoolIndex(pool_list)
+    build = time.perf_counter() - start
+    naive = NaiveScan(pool_list)
+    print(f"卡池: {len(pool_list)}, 建索引: {build * 1000:.1f} ms")
+
+    rng = random.Random(0)
+    lo, hi = index.bounds[0], index.bounds[-1]
+    item_ids = sorted(set(index.five_star_index) | set(index.four_star_index))
+    points = [(rng.randint(lo, hi),) for _ in range(args.queries)]
+    ranges = []
+    for _ in range(args.queries):
+        start = rng.randint(lo, hi)
+        ranges.append((start, start + rng.randint(0, 30 * 24 * 3600)))
+    items = [(rng.choice(item_ids),) for _ in range(args.queries)]
+
+    cases = {
+        "active_at": (index.active_at, naive.active_at, points),
+        "overlapping": (index.overlapping, naive.overlapping, ranges),
+        "by_item": (index.by_item, naive.by_item, items),
+    }
+    for name, (indexed, scan, queries) in cases.items():
+        for query in queries[:50]:
+            assert key(indexed(*query)) == key(scan(*query)), (name, query)
+        indexed_time = bench(indexed, queries)
+        scan_time = bench(scan, queries)
+        print(
+            f"{name:<12} 索引 {indexed_time / len(queries) * 1e6:>9.1f} us"
+            f"  扫描 {scan_time / len(queries) * 1e6:>9.1f} us"
+            f"  {scan_time / indexed_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
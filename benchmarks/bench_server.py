@@ -0,0 +1,84 @@
+"""
+本地 HTTP 服务的吞吐量
+
+    python -m benchmarks.bench_server
+    python -m benchmarks.bench_server --connections 4 --seconds 5
+
+服务运行在同一进程的线程中, 客户端使用保持连接的 http.client 依次发送请求,
+结果包含客户端自身的开销, 是服务端吞吐量的下限.
+"""
+
+import argparse
+import http.client
+import threading
+import time
+from urllib.parse import quote
+
+from waves_pool_list.server import create_server
+
+
+def run_client(port: int, paths: list[str], headers: dict, seconds: float, counts):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    deadline = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < deadline:
+        for path in paths:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            count += 1
+    counts.append(count)
+    connection.close()
+
+
+def bench(port: int, paths, headers, connections: int, seconds: float) -> float:
+    counts: list[int] = []
+    threads = [
+        threading.Thread(
+            target=run_client, args=(port, paths, headers, seconds, counts)
+        )
+        for _ in range(connections)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server, loader = create_server(port=0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    dataset = loader.dataset
+    item_id = next(iter(dataset.index.five_star_index))
+    etag = dataset.pools.gzip_etag
+    cases = {
+        "/pools": (["/pools"], {"Accept-Encoding": "gzip"}),
+        "/pools 304": (
+            ["/pools"],
+            {"Accept-Encoding": "gzip", "If-None-Match": etag},
+        ),
+        "/pools/active": (["/pools/active"], {"Accept-Encoding": "gzip"}),
+        "/pools/item": ([f"/pools/item/{item_id}"], {"Accept-Encoding": "gzip"}),
+        "/pools/type": (
+            [f"/pools/type/{quote('角色活动唤取')}"],
+            {"Accept-Encoding": "gzip"},
+        ),
+    }
+    print(f"卡池: {len(dataset.index)}, 连接数: {args.connections}")
+    for name, (paths, headers) in cases.items():
+        rate = bench(port, paths, headers, args.connections, args.seconds)
+        print(f"{name:<16} {rate:>10,.0f} 请求/秒")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+抽卡模拟的吞吐量 (模拟的抽数/秒), 与逐抽循环比较
+
+    python -m benchmarks.bench_simulate
+    python -m benchmarks.bench_simulate --sequences 1000000 --banners 20
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from waves_pool_list.simulate import RULES, PityRules, simulate, timeline
+from waves_pool_list.storage import load_pool_list
+
+
+def reference(banners: int, n: int, income: int, rules: PityRules, seed: int):
+    """逐抽模拟, 返回每个序列在每个卡池使用的抽数"""
+    rng = random.Random(seed)
+    survival = rules.survival
+    # 第 k 抽 (已经 k - 1 抽没有出 5 星) 出 5 星的概率
+    rates = [0.0] + [
+        1 - survival[k] / survival[k - 1] for k in range(1, rules.hard_pity + 1)
+    ]
+    pulls = np.zeros((n, banners), dtype=np.int32)
+    for i in range(n):
+        pity, guaranteed, balance = 0, False, 0
+        for j in range(banners):
+            balance += income
+            used = 0
+            while balance > 0:
+                balance -= 1
+                used += 1
+                pity += 1
+                if rng.random() < rates[pity]:
+                    pity = 0
+                    if guaranteed or rng.random() < rules.featured_rate:
+                        guaranteed = False
+                        break
+                    guaranteed = rules.featured_rate < 1
+            pulls[i, j] = used
+    return pulls
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sequences", type=int, default=200_000)
+    parser.add_argument("--banners", type=int, default=10)
+    parser.add_argument("--income", type=int, default=80)
+    parser.add_argument("--reference-sequences", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for pool_type, rules in RULES.items():
+        banners = timeline(load_pool_list(), pool_type)[-args.banners :]
+
+        start = time.perf_counter()
+        result = simulate(banners, args.sequences, income=args.income, seed=0)
+        elapsed = time.perf_counter() - start
+        total = int(result.pulls.sum())
+
+        n = args.reference_sequences
+        start = time.perf_counter()
+        expected = reference(len(banners), n, args.income, rules, seed=0)
+        reference_elapsed = time.perf_counter() - start
+        reference_total = int(expected.sum())
+
+        # 两种实现的随机数不同, 比较每个卡池的平均抽数
+        mean = result.pulls.mean(axis=0)
+        reference_mean = expected.mean(axis=0)
+        assert np.allclose(mean, reference_mean, rtol=0.05), (mean, reference_mean)
+
+        rate = total / elapsed
+        reference_rate = reference_total / reference_elapsed
+        print(
+            f"{pool_type} 卡池: {len(banners)}, 序列: {args.sequences:,}"
+            f"  NumPy {rate:>14,.0f} 抽/秒"
+            f"  循环 {reference_rate:>12,.0f} 抽/秒"
+            f"  {rate / reference_rate:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
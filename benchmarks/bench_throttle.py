@@ -0,0 +1,151 @@
+"""
+限流和自适应并发在模拟的限流接口上的吞吐量
+
+    python -m benchmarks.bench_throttle
+    python -m benchmarks.bench_throttle --server-rate 50 --capacity 8 --client-rate 100
+
+模拟的接口同时处理 capacity 个请求时延迟为 latency, 更多的请求平分处理能力 (延迟变长);
+每秒超过 server-rate 个请求时返回 429 (Retry-After: 1). 两种情况都会按退避重试,
+比较固定并发直接请求和经过 ThrottledAdapter 的情况: 总耗时、成功的请求数、
+接口返回的 429 数量, 以及结束时限流调整到的速率和并发上限.
+"""
+
+import argparse
+import io
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from waves_pool_list.client import create_session, get_cache, set_session
+from waves_pool_list.config import KUROBBS_API_HOST
+from waves_pool_list.kurobbs import get_post_detail
+from waves_pool_list.metrics import metrics
+from waves_pool_list.replay import use_adapter
+from waves_pool_list.throttle import (
+    RateController,
+    ThrottledAdapter,
+    get_rate_controller,
+    set_rate_controller,
+)
+
+
+class SimulatedServer(BaseAdapter):
+    def __init__(self, rate: float, capacity: int, latency: float):
+        super().__init__()
+        self.rate = rate
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.recent: deque[float] = deque()
+        self.status: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def respond(self, request, status: int, body: dict, headers: dict | None = None):
+        with self._lock:
+            self.status[status] = self.status.get(status, 0) + 1
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def send(self, request, **kwargs):
+        now = time.monotonic()
+        with self._lock:
+            while self.recent and self.recent[0] <= now - 1:
+                self.recent.popleft()
+            throttled = len(self.recent) >= self.rate
+            if not throttled:
+                self.recent.append(now)
+                self.in_flight += 1
+                # 超过 capacity 时平分处理能力
+                delay = self.latency * max(1, self.in_flight / self.capacity)
+        if throttled:
+            time.sleep(self.latency / 10)
+            return self.respond(request, 429, {"code": 429}, {"Retry-After": "1"})
+        time.sleep(delay)
+        with self._lock:
+            self.in_flight -= 1
+        return self.respond(request, 200, {"code": 200, "data": {}})
+
+    def close(self):
+        pass
+
+
+def run(adapter, post_ids: list[str], workers: int) -> tuple[float, int]:
+    session = create_session(workers)
+    use_adapter(session, adapter)
+    set_session(session)
+    metrics.reset()
+
+    def fetch(post_id: str) -> bool:
+        try:
+            get_post_detail(post_id)
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        succeeded = sum(executor.map(fetch, post_ids))
+    return time.perf_counter() - start, succeeded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--server-rate", type=float, default=40)
+    parser.add_argument("--capacity", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument(
+        "--client-rate", type=float, default=None, help="令牌桶速率, 默认使用配置"
+    )
+    args = parser.parse_args()
+
+    get_cache().enabled = False
+    post_ids = [str(i) for i in range(args.requests)]
+    print(
+        f"请求: {args.requests}, 线程: {args.workers}, 接口: {args.server_rate:g} 次/秒,"
+        f" 同时处理 {args.capacity} 个, 延迟 {args.latency * 1000:g} ms"
+    )
+
+    cases = {
+        f"固定 {args.workers} 并发": lambda server: server,
+        "ThrottledAdapter": lambda server: ThrottledAdapter(server),
+    }
+    for throttled, (name, wrap) in enumerate(cases.items()):
+        controller = (
+            RateController()
+            if args.client_rate is None
+            else RateController(rate=args.client_rate, burst=int(args.client_rate))
+        )
+        set_rate_controller(KUROBBS_API_HOST, controller)
+        server = SimulatedServer(args.server_rate, args.capacity, args.latency)
+        elapsed, succeeded = run(wrap(server), post_ids, args.workers)
+        retries = sum(metrics.report()["retries"].values())
+        line = (
+            f"{name:<18} 耗时 {elapsed:>6.2f} s  {succeeded / elapsed:>7.1f} 个/秒"
+            f"  成功 {succeeded:>4}  429 {server.status.get(429, 0):>4}"
+            f"  重试 {retries:>4}"
+        )
+        if throttled:
+            controller = get_rate_controller()
+            line += (
+                f"  速率 {controller.bucket.rate:>5.1f}/秒"
+                f"  并发上限 {controller.concurrency.limit:>4.1f}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
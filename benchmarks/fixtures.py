@@ -0,0 +1,201 @@
+"""
+基准测试使用的 HTTP 录制数据
+
+优先使用 record 录制的真实请求 (fixtures/http 目录),
+没有录制数据时根据 data/pool.json 生成格式相同的搜索结果、帖子详情和角色武器数据
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from waves_pool_list.catalog import CHARACTER_DATA_URL, WEAPON_DATA_URL, Catalog
+from waves_pool_list.client import create_session, get_cache, set_session
+from waves_pool_list.config import SEARCH_PAGE_SIZES
+from waves_pool_list.crawler import crawl, filter_post_list
+from waves_pool_list.fixed import FIXED_POOL_LIST
+from waves_pool_list.kurobbs import ANN_CONTENT_URL, POST_PAGE_URL, SEARCH_URL
+from waves_pool_list.replay import (
+    Fixture,
+    RecordingAdapter,
+    fixture_key,
+    load_fixtures,
+    use_adapter,
+)
+from waves_pool_list.storage import load_pool_list
+from waves_pool_list.throttle import ThrottledAdapter
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+HTTP_FIXTURES_PATH = FIXTURES_PATH / "http"
+
+KEYWORDS = ("角色活动唤取", "武器活动唤取")
+
+Post = tuple[dict[str, Any], dict[str, Any]]
+
+
+def record(end_page: int | None = None):
+    """完整获取一次卡池列表, 录制所有请求"""
+    session = create_session()
+    # 录制时访问真实接口, 同样需要限流和重试
+    use_adapter(session, ThrottledAdapter(RecordingAdapter(HTTP_FIXTURES_PATH)))
+    set_session(session)
+    get_cache().enabled = False
+    crawl(end_page=end_page)
+
+
+def _format_time(value: str) -> str:
+    date, time = value.split(" ")
+    year, month, day = (int(part) for part in date.split("-"))
+    return f"{year}年{month}月{day}日{time[:5]}"
+
+
+def synthesize_posts(pool_list: list[dict[str, Any]]) -> list[Post]:
+    """
+    按公告的格式为每个帖子生成搜索结果和帖子详情, 同一帖子只取第一个卡池
+
+    固定卡池的帖子不生成: crawl 总会加入固定卡池, 再搜索到同一帖子会得到重复的卡池
+    """
+    fixed_post_ids = {
+        pool["bbs"].removeprefix(POST_PAGE_URL) for pool in FIXED_POOL_LIST
+    }
+    posts = {}
+    for pool in pool_list:
+        post_id = pool["bbs"].removeprefix(POST_PAGE_URL)
+        if not post_id or post_id in posts or post_id in fixed_post_ids:
+            continue
+        kind = pool["pool_type"][:2]
+        five_star = "".join(f"「{name}」" for name in pool["five_star_names"])
+        four_star = "".join(f"「{name}」" for name in pool["four_star_names"])
+        if pool["start_time"] == "版本更新时间":
+            start_time = "版本更新后"
+        else:
+            start_time = _format_time(pool["start_time"])
+        end_time = _format_time(pool["end_time"])
+        post = {
+            "postId": post_id,
+            "postTitle": f"「{pool.get('name', '')}」{pool['pool_type']}"
+            f"·<em>&lt;{pool['title']}&gt;</em>即将开启",
+            "userId": "10012001",
+            "imgContent": [{"url": pool["pic"]}],
+        }
+        post_content = [
+            {"contentType": 1, "content": f"{pool['pool_type']}即将开启"},
+            {"contentType": 2, "url": pool["pic"]},
+            {"contentType": 1, "content": f"{start_time} ~ {end_time}（服务器时间）"},
+            {
+                "contentType": 1,
+                "content": f"活动期间，限定5星{kind}{five_star}、"
+                f"4星{kind}{four_star}唤取概率大幅提升！",
+            },
+        ]
+        detail = {"code": 200, "data": {"postDetail": {"postContent": post_content}}}
+        posts[post_id] = (post, detail)
+    return list(posts.values())
+
+
+def synthesize_catalog_data(
+    pool_list: list[dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    raw_character_data = {}
+    raw_weapon_data = {}
+    for pool in pool_list:
+        for star, ids, names in (
+            (5, pool["five_star_ids"], pool["five_star_names"]),
+            (4, pool["four_star_ids"], pool["four_star_names"]),
+        ):
+            for item_id, name in zip(ids, names):
+                if pool["pool_type"] == "角色活动唤取":
+                    raw_character_data[item_id] = {"zh-Hans": name, "element": star}
+                else:
+                    raw_weapon_data[item_id] = {"zh-Hans": name, "rank": star}
+    return raw_character_data, raw_weapon_data
+
+
+def _json_fixture(method: str, url: str, data: dict[str, Any] | None, value: Any):
+    return Fixture(
+        method=method,
+        url=url,
+        body=urlencode(data) if data else "",
+        headers={"Content-Type": "application/json"},
+        content=json.dumps(value, ensure_ascii=False),
+    )
+
+
+def synthesize_fixtures(pool_list: list[dict[str, Any]]) -> dict[str, Fixture]:
+    raw_character_data, raw_weapon_data = synthesize_catalog_data(pool_list)
+    fixtures = [
+        _json_fixture("GET", CHARACTER_DATA_URL, None, raw_character_data),
+        _json_fixture("GET", WEAPON_DATA_URL, None, raw_weapon_data),
+    ]
+
+    posts = synthesize_posts(pool_list)
+    # 搜索结果按发帖时间倒序
+    posts.sort(key=lambda post: int(post[0]["postId"]), reverse=True)
+    for keyword in KEYWORDS:
+        post_list = [post for post, _ in posts if keyword in post["postTitle"]]
+        # 每种每页数量都生成到最后一页之后的空页为止
+        for page_size in SEARCH_PAGE_SIZES:
+            page_count = -(-len(post_list) // page_size)
+            for page in range(1, page_count + 2):
+                data = {
+                    "gameId": 3,
+                    "keyword": keyword,
+                    "pageIndex": page,
+                    "pageSize": page_size,
+                    "searchType": 3,
+                }
+                page_posts = post_list[(page - 1) * page_size : page * page_size]
+                value = {"code": 200, "data": {"post": {"postList": page_posts}}}
+                fixtures.append(_json_fixture("POST", SEARCH_URL, data, value))
+
+    for post, detail in posts:
+        data = {"isOnlyPublisher": 1, "postId": post["postId"], "showOrderType": 2}
+        fixtures.append(_json_fixture("POST", ANN_CONTENT_URL, data, detail))
+
+    return {fixture_key(fixture): fixture for fixture in fixtures}
+
+
+def get_fixtures() -> tuple[dict[str, Fixture], str]:
+    """返回 HTTP 录制数据和数据来源"""
+    if HTTP_FIXTURES_PATH.exists():
+        fixtures = load_fixtures(HTTP_FIXTURES_PATH)
+        if fixtures:
+            return fixtures, "recorded"
+    return synthesize_fixtures(load_pool_list()), "synthetic"
+
+
+def _find_fixture(fixtures: dict[str, Fixture], url: str) -> Fixture:
+    for fixture in fixtures.values():
+        if fixture.url == url:
+            return fixture
+    raise KeyError(url)
+
+
+def load_posts() -> tuple[list[Post], str]:
+    """从 HTTP 录制数据中取出筛选后的帖子和对应的帖子详情"""
+    fixtures, source = get_fixtures()
+    details = {}
+    for fixture in fixtures.values():
+        if fixture.url == ANN_CONTENT_URL:
+            post_id = dict(parse_qsl(fixture.body))["postId"]
+            details[post_id] = json.loads(fixture.content)
+
+    posts = {}
+    for fixture in fixtures.values():
+        if fixture.url != SEARCH_URL:
+            continue
+        keyword = dict(parse_qsl(fixture.body))["keyword"]
+        post_list = json.loads(fixture.content)["data"]["post"]["postList"]
+        for post in filter_post_list(post_list, keyword):
+            if post["postId"] in details:
+                posts[post["postId"]] = (post, details[post["postId"]])
+    return [posts[post_id] for post_id in sorted(posts)], source
+
+
+def load_catalog() -> Catalog:
+    fixtures, _ = get_fixtures()
+    return Catalog.from_raw(
+        json.loads(_find_fixture(fixtures, CHARACTER_DATA_URL).content),
+        json.loads(_find_fixture(fixtures, WEAPON_DATA_URL).content),
+    )
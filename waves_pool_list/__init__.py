@@ -0,0 +1,20 @@
+"""
+鸣潮卡池列表
+
+导入时不会访问网络, 角色和武器数据在第一次使用时下载
+"""
+
+from .catalog import Catalog, get_catalog
+from .crawler import crawl, get_pool_list
+from .query import PoolIndex
+from .storage import load_pool_list, save_pool_list
+
+__all__ = [
+    "Catalog",
+    "PoolIndex",
+    "crawl",
+    "get_catalog",
+    "get_pool_list",
+    "load_pool_list",
+    "save_pool_list",
+]
@@ -0,0 +1,191 @@
+"""
+卡池统计
+
+把卡池列表转换为 NumPy 数组后一次计算所有角色和武器的统计:
+
+    arrays = PoolArrays.load()
+    rerun_stats(arrays)          # 每个 5 星的登场次数和复刻间隔
+    four_star_frequency(arrays)  # 每个 4 星的 UP 次数
+    banner_overlap(arrays)       # 同时开放的角色卡池和武器卡池
+
+结果都是 {列名: 数组} 形式, 同一行对应同一个角色/武器或同一对卡池.
+需要安装 numpy: uv sync --extra analytics 或 pip install numpy
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "卡池统计需要 numpy: uv sync --extra analytics 或 pip install numpy"
+    ) from e
+
+from .config import POOL_LIST_PATH
+from .storage import load_pool_list
+from .timeline import TimeLike, pool_intervals, to_timestamp
+
+DAY = 24 * 60 * 60
+POOL_TYPE_CODES = {"角色活动唤取": 0, "武器活动唤取": 1}
+CHARACTER, WEAPON = 0, 1
+
+
+@dataclass
+class PoolArrays:
+    """
+    卡池列表的数组形式
+
+    item_ids 为所有出现过的角色/武器 id, 其他数组中用下标 (编码) 表示;
+    five_pool / five_item 成对出现, 表示第 five_pool 个卡池的 5 星 UP 包含 five_item,
+    four_pool / four_item 同理
+    """
+
+    item_ids: np.ndarray
+    item_names: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    pool_type: np.ndarray
+    five_pool: np.ndarray
+    five_item: np.ndarray
+    four_pool: np.ndarray
+    four_item: np.ndarray
+
+    @classmethod
+    def from_pool_list(cls, pool_list: list[dict[str, Any]]) -> "PoolArrays":
+        names: dict[str, str] = {}
+        for pool in pool_list:
+            names.update(zip(pool["five_star_ids"], pool["five_star_names"]))
+            names.update(zip(pool["four_star_ids"], pool["four_star_names"]))
+        item_ids = sorted(names)
+        codes = {item_id: code for code, item_id in enumerate(item_ids)}
+
+        def pairs(field: str) -> tuple[np.ndarray, np.ndarray]:
+            pool_index = [i for i, pool in enumerate(pool_list) for _ in pool[field]]
+            items = [codes[item_id] for pool in pool_list for item_id in pool[field]]
+            return np.array(pool_index, dtype=np.int32), np.array(items, dtype=np.int32)
+
+        intervals = np.array(pool_intervals(pool_list), dtype=np.int64).reshape(-1, 2)
+        five_pool, five_item = pairs("five_star_ids")
+        four_pool, four_item = pairs("four_star_ids")
+        return cls(
+            item_ids=np.array(item_ids),
+            item_names=np.array([names[item_id] for item_id in item_ids]),
+            start=intervals[:, 0],
+            end=intervals[:, 1],
+            pool_type=np.array(
+                [POOL_TYPE_CODES.get(pool["pool_type"], -1) for pool in pool_list],
+                dtype=np.int8,
+            ),
+            five_pool=five_pool,
+            five_item=five_item,
+            four_pool=four_pool,
+            four_item=four_item,
+        )
+
+    @classmethod
+    def load(cls, path: Path = POOL_LIST_PATH) -> "PoolArrays":
+        return cls.from_pool_list(load_pool_list(path))
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+
+def rerun_stats(
+    arrays: PoolArrays, now: TimeLike | None = None
+) -> dict[str, np.ndarray]:
+    """
+    每个 5 星 UP 的登场次数和复刻间隔 (天)
+
+    同一个 5 星在同一时间开放的多个卡池算作一次登场; 间隔为上一次结束到下一次开始.
+    now 不为 None 时计算距离上一次结束的天数, 可以用来比较不同时间点的情况
+    """
+    start = arrays.start[arrays.five_pool]
+    end = arrays.end[arrays.five_pool]
+    item = arrays.five_item
+    # 按 (角色/武器, 开始时间) 排序, 去掉同一时间的重复登场
+    order = np.lexsort((end, start, item))
+    item, start, end = item[order], start[order], end[order]
+    keep = np.ones(len(item), dtype=bool)
+    keep[1:] = (item[1:] != item[:-1]) | (start[1:] != start[:-1])
+    item, start, end = item[keep], start[keep], end[keep]
+
+    n_items = len(arrays.item_ids)
+    appearances = np.bincount(item, minlength=n_items)
+    # 同一角色/武器相邻两次登场之间的间隔
+    same = item[1:] == item[:-1]
+    gap_item = item[1:][same]
+    gaps = (start[1:] - end[:-1])[same] / DAY
+    gap_count = np.bincount(gap_item, minlength=n_items)
+    gap_sum = np.bincount(gap_item, weights=gaps, minlength=n_items)
+    gap_min = np.full(n_items, np.nan)
+    gap_max = np.full(n_items, np.nan)
+    np.fmin.at(gap_min, gap_item, gaps)
+    np.fmax.at(gap_max, gap_item, gaps)
+    first_start = np.full(n_items, np.iinfo(np.int64).max)
+    last_end = np.full(n_items, np.iinfo(np.int64).min)
+    np.minimum.at(first_start, item, start)
+    np.maximum.at(last_end, item, end)
+
+    mask = appearances > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gap_mean = gap_sum / gap_count
+    result = {
+        "id": arrays.item_ids[mask],
+        "name": arrays.item_names[mask],
+        "appearances": appearances[mask],
+        "first_start": first_start[mask],
+        "last_end": last_end[mask],
+        "gap_mean": gap_mean[mask],
+        "gap_min": gap_min[mask],
+        "gap_max": gap_max[mask],
+    }
+    if now is not None:
+        result["days_since_last"] = (to_timestamp(now) - result["last_end"]) / DAY
+    return result
+
+
+def four_star_frequency(arrays: PoolArrays) -> dict[str, np.ndarray]:
+    """每个 4 星在角色卡池和武器卡池中的 UP 次数, 以及最后一次 UP 的结束时间"""
+    n_items = len(arrays.item_ids)
+    pool_type = arrays.pool_type[arrays.four_pool]
+    character = np.bincount(arrays.four_item[pool_type == CHARACTER], minlength=n_items)
+    weapon = np.bincount(arrays.four_item[pool_type == WEAPON], minlength=n_items)
+    total = np.bincount(arrays.four_item, minlength=n_items)
+    last_end = np.full(n_items, np.iinfo(np.int64).min)
+    np.maximum.at(last_end, arrays.four_item, arrays.end[arrays.four_pool])
+
+    mask = total > 0
+    return {
+        "id": arrays.item_ids[mask],
+        "name": arrays.item_names[mask],
+        "count": total[mask],
+        "character_count": character[mask],
+        "weapon_count": weapon[mask],
+        "last_end": last_end[mask],
+    }
+
+
+def banner_overlap(arrays: PoolArrays) -> dict[str, np.ndarray]:
+    """
+    时间上有重叠的 (角色卡池, 武器卡池) 对
+
+    overlap 为重叠的天数, ratio 为重叠部分占角色卡池时长的比例
+    """
+    character = np.flatnonzero(arrays.pool_type == CHARACTER)
+    weapon = np.flatnonzero(arrays.pool_type == WEAPON)
+    c_start = arrays.start[character][:, None]
+    c_end = arrays.end[character][:, None]
+    w_start = arrays.start[weapon][None, :]
+    w_end = arrays.end[weapon][None, :]
+    overlap = np.minimum(c_end, w_end) - np.maximum(c_start, w_start)
+    c_index, w_index = np.nonzero(overlap > 0)
+    seconds = overlap[c_index, w_index]
+    duration = (c_end - c_start)[c_index, 0]
+    return {
+        "character_pool": character[c_index],
+        "weapon_pool": weapon[w_index],
+        "overlap": seconds / DAY,
+        "ratio": seconds / np.maximum(duration, 1),
+    }
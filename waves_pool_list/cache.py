@@ -0,0 +1,162 @@
+"""
+本地响应缓存
+
+以请求内容 (method + url + 参数) 的 sha256 作为文件名保存响应,
+每个接口单独设置过期时间, 超出容量时淘汰最久未访问的条目,
+过期条目带上 ETag / Last-Modified 向服务器重新验证
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ValidationError
+
+from .metrics import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+
+class CacheEntry(BaseModel):
+    url: str
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    body: str
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        root: Path,
+        max_size: int = 128 * 1024 * 1024,
+        enabled: bool = True,
+    ):
+        self.root = root
+        self.max_size = max_size
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # 缓存目录的总大小, 第一次写入时统计
+        self._size: int | None = None
+
+    @staticmethod
+    def make_key(method: str, url: str, data: dict[str, Any] | None = None) -> str:
+        raw = json.dumps(
+            [method.upper(), url, data or {}], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            entry = CacheEntry.model_validate_json(text)
+        except ValidationError:
+            path.unlink(missing_ok=True)
+            return None
+        # 更新访问时间, 淘汰时按访问时间排序
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = entry.model_dump_json().encode("utf-8")
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(raw)
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(raw) - old_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        return sum(path.stat().st_size for path in self.root.glob("*/*.json"))
+
+    def _evict(self):
+        files = []
+        for path in self.root.glob("*/*.json"):
+            stat = path.stat()
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        size = sum(file_size for _, file_size, _ in files)
+        for _, file_size, path in files:
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= file_size
+        self._size = size
+
+    def request_json(
+        self,
+        session: "requests.Session",
+        method: str,
+        url: str,
+        ttl: float | None,
+        cacheable: Callable[[Any], bool] | None = None,
+        **kwargs,
+    ) -> Any:
+        """
+        发起请求并返回 json
+
+        ttl 为缓存有效期 (秒), None 表示永不过期;
+        cacheable 用于判断响应内容是否可以缓存, 例如接口返回了错误码
+        """
+        if not self.enabled:
+            res = session.request(method, url, **kwargs)
+            res.raise_for_status()
+            return res.json()
+
+        key = self.make_key(method, url, kwargs.get("data") or kwargs.get("params"))
+        entry = self.get(key)
+        if entry is not None and (ttl is None or time.time() - entry.stored_at < ttl):
+            metrics.record_cache(url, "hit")
+            return json.loads(entry.body)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        res = session.request(method, url, headers=headers, **kwargs)
+        if res.status_code == 304 and entry is not None:
+            metrics.record_cache(url, "revalidated")
+            entry.stored_at = time.time()
+            self.set(key, entry)
+            return json.loads(entry.body)
+
+        metrics.record_cache(url, "miss")
+        res.raise_for_status()
+        value = res.json()
+        if cacheable is None or cacheable(value):
+            self.set(
+                key,
+                CacheEntry(
+                    url=url,
+                    stored_at=time.time(),
+                    etag=res.headers.get("ETag"),
+                    last_modified=res.headers.get("Last-Modified"),
+                    body=res.content.decode("utf-8"),
+                ),
+            )
+        return value
@@ -0,0 +1,197 @@
+"""
+角色和武器数据
+
+数据来自 hakush, 第一次访问时才下载并构建, 之后在进程内复用:
+
+    from waves_pool_list import catalog
+
+    catalog.get_catalog().name2id["忌炎"]
+    catalog.id2name["1404"]
+    catalog.get_catalog().name("1404", "en")  # 其他语言, 见 names.py
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from .client import get_cache, get_session
+from .config import CATALOG_CACHE_TTL
+from .matcher import NameMatcher
+from .metrics import metrics
+from .names import CHARACTER, DEFAULT_LOCALE, WEAPON, NameTable
+
+if TYPE_CHECKING:
+    from .models import Character, Weapon
+
+CHARACTER_DATA_URL = "https://api.hakush.in/ww/data/character.json"
+WEAPON_DATA_URL = "https://api.hakush.in/ww/data/weapon.json"
+
+
+def fetch_character_data(ttl: float | None = CATALOG_CACHE_TTL):
+    value = get_cache().request_json(
+        get_session(),
+        "GET",
+        CHARACTER_DATA_URL,
+        ttl=ttl,
+    )
+    return value
+
+
+def fetch_weapon_data(ttl: float | None = CATALOG_CACHE_TTL):
+    value = get_cache().request_json(
+        get_session(),
+        "GET",
+        WEAPON_DATA_URL,
+        ttl=ttl,
+    )
+    return value
+
+
+def load_cached_data(url: str) -> Any | None:
+    """读取本地缓存中的 hakush 数据, 不论是否过期, 不请求网络; 没有缓存时返回 None"""
+    cache = get_cache()
+    entry = cache.get(cache.make_key("GET", url))
+    return None if entry is None else json.loads(entry.body)
+
+
+class Catalog:
+    """
+    所有语言的名称保存在 NameTable 中; id2name 等默认语言 (简体中文) 的字典和
+    char_list / weapon_list 在第一次访问时才构建
+    """
+
+    def __init__(self, table: NameTable):
+        self.table = table
+
+    @property
+    def locales(self) -> tuple[str, ...]:
+        return self.table.locales
+
+    def name(self, item_id: str, locale: str = DEFAULT_LOCALE) -> str | None:
+        return self.table.name(item_id, locale)
+
+    def id(self, name: str, locale: str | None = DEFAULT_LOCALE) -> str | None:
+        return self.table.id(name, locale)
+
+    @cached_property
+    def char_list(self) -> list[Character]:
+        from .models import Character
+
+        return [
+            Character(char_id=item_id, char_name=name, star=star)
+            for item_id, name, kind, star in self.table.rows()
+            if kind == "character"
+        ]
+
+    @cached_property
+    def weapon_list(self) -> list[Weapon]:
+        from .models import Weapon
+
+        return [
+            Weapon(weapon_id=item_id, weapon_name=name, star=star)
+            for item_id, name, kind, star in self.table.rows()
+            if kind == "weapon"
+        ]
+
+    @cached_property
+    def id2char_name(self) -> dict[str, str]:
+        return self.table.id2name(kind=CHARACTER)
+
+    @cached_property
+    def name2char_id(self) -> dict[str, str]:
+        return self.table.name2id(kind=CHARACTER)
+
+    @cached_property
+    def id2weapon_name(self) -> dict[str, str]:
+        return self.table.id2name(kind=WEAPON)
+
+    @cached_property
+    def name2weapon_id(self) -> dict[str, str]:
+        return self.table.name2id(kind=WEAPON)
+
+    @cached_property
+    def id2name(self) -> dict[str, str]:
+        return self.table.id2name()
+
+    @cached_property
+    def name2id(self) -> dict[str, str]:
+        return self.table.name2id()
+
+    @cached_property
+    def matcher(self) -> NameMatcher:
+        """所有角色和武器名称构建的自动机, 每个 Catalog 只构建一次"""
+        return NameMatcher(self.name2id)
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw_character_data: dict[str, Any],
+        raw_weapon_data: dict[str, Any],
+    ) -> Catalog:
+        return cls(NameTable.from_raw(raw_character_data, raw_weapon_data))
+
+    @classmethod
+    @metrics.stage("catalog")
+    def fetch(cls, ttl: float | None = CATALOG_CACHE_TTL) -> Catalog:
+        """ttl 为 0 时向服务器重新验证缓存的数据"""
+        return cls.from_raw(fetch_character_data(ttl), fetch_weapon_data(ttl))
+
+    @classmethod
+    def load_cached(cls) -> Catalog | None:
+        """从本地缓存构建, 不请求网络; 缓存中没有角色或武器数据时返回 None"""
+        raw_character_data = load_cached_data(CHARACTER_DATA_URL)
+        raw_weapon_data = load_cached_data(WEAPON_DATA_URL)
+        if raw_character_data is None or raw_weapon_data is None:
+            return None
+        return cls.from_raw(raw_character_data, raw_weapon_data)
+
+
+_catalog: Catalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(refresh: bool = False) -> Catalog:
+    """
+    获取进程内共享的 Catalog
+
+    refresh 为 True 时不使用缓存有效期内的数据, 向服务器重新验证 (没有变化时返回 304)
+    """
+    global _catalog
+    if _catalog is None or refresh:
+        with _catalog_lock:
+            if _catalog is None or refresh:
+                _catalog = Catalog.fetch(ttl=0 if refresh else CATALOG_CACHE_TTL)
+    return _catalog
+
+
+def set_catalog(catalog: Catalog):
+    """替换共享的 Catalog, 例如使用本地数据构建的 Catalog"""
+    global _catalog
+    with _catalog_lock:
+        _catalog = catalog
+
+
+_LAZY_ATTRIBUTES = {
+    "char_list",
+    "weapon_list",
+    "id2char_name",
+    "name2char_id",
+    "id2weapon_name",
+    "name2weapon_id",
+    "id2name",
+    "name2id",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(get_catalog(), name)
+    # pydantic 模型导入和构建较慢, 用到时再导入
+    if name in ("Character", "Weapon"):
+        from . import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
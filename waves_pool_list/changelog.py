@@ -0,0 +1,130 @@
+"""
+卡池列表的变更记录
+
+每次卡池列表变化时, 把新增、修改、删除的卡池追加到 changelog.jsonl, 每行一条:
+
+    {"seq": 105, "op": "add", "key": "1440437236297134080:武器活动唤取:21050046", "pool": {...}}
+    {"seq": 106, "op": "remove", "key": "..."}
+
+seq 单调递增. 文件只追加, 使用方记下 manifest.json 中的 seq 和文件大小,
+下次只需读取 (或用 Range 请求下载) 该位置之后的内容.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .config import CHANGELOG_PATH
+from .kurobbs import POST_PAGE_URL
+
+
+def pool_key(pool: dict[str, Any]) -> str:
+    """
+    帖子 id + 卡池类型 + 5 星 UP 的 id
+
+    同一个帖子可能包含多个同类型的卡池 (例如复刻), 所以加上 5 星 UP 区分
+    """
+    post_id = pool["bbs"].removeprefix(POST_PAGE_URL)
+    return f"{post_id}:{pool['pool_type']}:{','.join(pool['five_star_ids'])}"
+
+
+def diff_pool_lists(
+    old_pool_list: list[dict[str, Any]], new_pool_list: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """比较两个卡池列表, 返回没有 seq 的变更, 顺序为新列表中的顺序, 删除在最后"""
+    old_pools = {pool_key(pool): pool for pool in old_pool_list}
+    new_keys = set()
+    changes = []
+    for pool in new_pool_list:
+        key = pool_key(pool)
+        new_keys.add(key)
+        if key not in old_pools:
+            changes.append({"op": "add", "key": key, "pool": pool})
+        elif old_pools[key] != pool:
+            changes.append({"op": "change", "key": key, "pool": pool})
+    for key in old_pools:
+        if key not in new_keys:
+            changes.append({"op": "remove", "key": key})
+    return changes
+
+
+def last_seq(path: Path = CHANGELOG_PATH) -> int:
+    """读取最后一条变更的 seq, 只读取文件末尾"""
+    if not path.exists():
+        return 0
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        block = 4096
+        while True:
+            start = max(size - block, 0)
+            f.seek(start)
+            lines = f.read().splitlines()
+            # 第一行可能不完整, 除非已经读到文件开头
+            complete = lines if start == 0 else lines[1:]
+            for line in reversed(complete):
+                try:
+                    return json.loads(line)["seq"]
+                except json.JSONDecodeError:
+                    # 写到一半中断的最后一行
+                    continue
+            if start == 0:
+                return 0
+            block *= 2
+
+
+def ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def append_changes(
+    changes: list[dict[str, Any]], path: Path = CHANGELOG_PATH
+) -> tuple[int, int]:
+    """追加变更并编号, 返回最后的 seq 和文件大小"""
+    seq = last_seq(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        if f.tell() > 0 and not ends_with_newline(path):
+            # 上次写到一半中断, 另起一行
+            f.write("\n")
+        for change in changes:
+            seq += 1
+            record = {"seq": seq, **change}
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    return seq, path.stat().st_size
+
+
+def read_changes(since: int = 0, path: Path = CHANGELOG_PATH) -> list[dict[str, Any]]:
+    """读取 seq 大于 since 的变更"""
+    if not path.exists():
+        return []
+    changes = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                change = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if change["seq"] > since:
+                changes.append(change)
+    return changes
+
+
+def apply_changes(
+    pool_list: list[dict[str, Any]], changes: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    把变更应用到旧的卡池列表上
+
+    结果包含的卡池与服务器相同, 修改的卡池保持原来的位置, 新增的卡池在最后;
+    需要与 pool.json 顺序一致时按 end_timestamp 排序.
+    """
+    pools = {pool_key(pool): pool for pool in pool_list}
+    for change in changes:
+        if change["op"] == "remove":
+            pools.pop(change["key"], None)
+        else:
+            pools[change["key"]] = change["pool"]
+    return list(pools.values())
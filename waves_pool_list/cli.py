@@ -0,0 +1,201 @@
+import argparse
+import cProfile
+import json
+import tracemalloc
+from pathlib import Path
+
+from .catalog import get_catalog
+from .client import DEFAULT_POOL_SIZE, create_session, get_cache, set_session
+from .config import (
+    DATABASE_PATH,
+    MAX_WORKERS,
+    WATCH_INTERVAL,
+)
+from .crawler import crawl
+from .database import PoolDatabase
+from .images import mirror_images
+from .metrics import metrics
+from .pipeline import clear_checkpoint, stream_pool_list
+from .server import serve
+from .storage import save_pool_list
+from .watch import watch
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="鸣潮卡池列表")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="只获取 pool.json 中没有的帖子, 遇到全是已知帖子的页面就停止翻页",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="不读写本地缓存, 所有请求都访问网络",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="流式获取, 边获取边写入检查点, 中途失败后再次运行会从检查点继续",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="并发获取帖子详情的线程数",
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=None,
+        help="每个关键词最多搜索的页数, 默认搜索到最后一页",
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        nargs="?",
+        const=DATABASE_PATH,
+        metavar="PATH",
+        help="把卡池和角色武器数据写入 SQLite 数据库 (默认 data/pool.db), "
+        "只更新有变化的帖子, 再从数据库导出 JSON 文件",
+    )
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="把卡池图片按内容哈希下载到 data/images, 在卡池中记录本地路径和尺寸, "
+        "已下载的图片不再重复传输",
+    )
+    parser.add_argument(
+        "--watch",
+        type=float,
+        nargs="?",
+        const=WATCH_INTERVAL,
+        metavar="SECONDS",
+        help="常驻运行, 每隔一段时间 (默认 600 秒) 只检查搜索结果的第一页, "
+        "有新帖子时才增量获取并写入",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="不获取卡池, 启动本地 HTTP 服务提供 data/pool.json, 文件更新后自动重新加载",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="--serve 监听的地址")
+    parser.add_argument("--port", type=int, default=8000, help="--serve 监听的端口")
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="把各阶段耗时、请求数、延迟分布、缓存命中率等指标写入 JSON 文件",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        metavar="PATH",
+        help="用 cProfile 记录本次运行, 保存为 pstats 文件",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="记录内存分配, 在指标中加入内存峰值和分配最多的代码行",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+    if args.no_cache:
+        get_cache().enabled = False
+    # 线程数超过默认连接池大小时按线程数创建 Session, 流式获取时还有一个搜索线程
+    if args.workers + 1 > DEFAULT_POOL_SIZE:
+        set_session(create_session(args.workers + 1))
+
+    metrics.reset()
+    if args.tracemalloc:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if args.cprofile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+        if args.profile:
+            report = metrics.report()
+            if args.tracemalloc:
+                report["memory"] = memory_report()
+            with open(args.profile, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=4, ensure_ascii=False)
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+
+def memory_report(limit: int = 10) -> dict:
+    current, peak = tracemalloc.get_traced_memory()
+    stats = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+    return {
+        "current": current,
+        "peak": peak,
+        "top": [
+            {"line": str(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in stats
+        ],
+    }
+
+
+def run(args: argparse.Namespace):
+    if args.serve:
+        serve(args.host, args.port)
+        return
+
+    if args.watch is not None:
+        watch(
+            lambda: save(
+                args,
+                # 检查时已经确认有新帖子, 不能使用缓存中的旧搜索结果
+                crawl(
+                    incremental=True,
+                    end_page=args.pages,
+                    max_workers=args.workers,
+                    search_ttl=0,
+                ),
+            ),
+            interval=args.watch,
+        )
+        return
+
+    if args.stream:
+        pool_list = stream_pool_list(
+            incremental=args.incremental,
+            end_page=args.pages,
+            max_workers=args.workers,
+        )
+        save(args, pool_list)
+        clear_checkpoint()
+        return
+
+    pool_list = crawl(
+        incremental=args.incremental,
+        end_page=args.pages,
+        max_workers=args.workers,
+    )
+    save(args, pool_list)
+
+
+def save(args: argparse.Namespace, pool_list: list[dict]):
+    if args.mirror:
+        pool_list = mirror_images(pool_list, max_workers=args.workers)
+    if args.sqlite is None:
+        changed = save_pool_list(pool_list)
+    else:
+        with PoolDatabase(args.sqlite) as db:
+            result = db.sync(pool_list)
+            db.save_catalog(get_catalog())
+            changed = db.export()
+        print(
+            f"数据库: 写入 {result['written']} 个帖子, 删除 {result['deleted']} 个帖子, "
+            f"调整顺序 {result['moved']} 个卡池"
+        )
+    if not changed:
+        print("卡池列表没有变化, 不写入文件")
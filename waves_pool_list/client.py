@@ -0,0 +1,90 @@
+"""
+共享的 HTTP Session 和响应缓存
+
+第一次使用时创建, 同一进程内的所有请求共用
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from .config import CACHE_DIR, KUROBBS_MAX_CONCURRENCY, MAX_WORKERS
+from .metrics import metrics
+from .throttle import ThrottledAdapter
+
+if TYPE_CHECKING:
+    import requests
+
+    from .cache import ResponseCache
+
+# 自适应并发最多同时发出 KUROBBS_MAX_CONCURRENCY 个请求, 连接池不能比它小,
+# 否则多出的连接用完就被丢弃, 下次请求重新建立
+DEFAULT_POOL_SIZE = max(MAX_WORKERS, KUROBBS_MAX_CONCURRENCY)
+
+_session: requests.Session | None = None
+_cache: ResponseCache | None = None
+_lock = threading.Lock()
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    创建复用连接的 Session, 连接池大小不小于同时请求的线程数
+
+    库街区接口的请求经过限流和重试, 见 throttle.py
+    """
+    # requests 导入较慢, 用到时再导入
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = ThrottledAdapter(
+        HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(_record_response)
+    return session
+
+
+def _record_response(response: requests.Response, *args, **kwargs):
+    metrics.record_request(
+        response.url,
+        response.elapsed.total_seconds(),
+        len(response.content),
+        response.status_code,
+    )
+
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def set_session(session: requests.Session):
+    """替换共享的 Session, 例如挂载了录制或回放 adapter 的 Session"""
+    global _session
+    with _lock:
+        _session = session
+
+
+def get_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                # 缓存条目是 pydantic 模型, 用到时再导入
+                from .cache import ResponseCache
+
+                _cache = ResponseCache(CACHE_DIR)
+    return _cache
+
+
+def set_cache(cache: ResponseCache):
+    global _cache
+    with _lock:
+        _cache = cache
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).parents[1]
+DATA_PATH = ROOT_PATH / "data"
+POOL_LIST_PATH = DATA_PATH / "pool.json"
+COMPRESSED_POOL_LIST_PATH = DATA_PATH / "compressed_pool.json"
+# 卡池列表的哈希, 只在卡池列表变化时更新
+MANIFEST_PATH = DATA_PATH / "manifest.json"
+# 按卡池类型和结束时间的年份拆分的卡池列表
+SHARD_DIR = DATA_PATH / "shards"
+# 卡池列表每次变化时追加的变更记录
+CHANGELOG_PATH = DATA_PATH / "changelog.jsonl"
+# 使用 --mirror 时按内容哈希保存的卡池图片, 以及图片链接到本地文件的索引
+IMAGE_DIR = DATA_PATH / "images"
+IMAGE_INDEX_PATH = IMAGE_DIR / "index.json"
+CACHE_DIR = ROOT_PATH / ".cache"
+# 使用 --sqlite 时的数据库文件
+DATABASE_PATH = DATA_PATH / "pool.db"
+
+# 各接口的缓存有效期 (秒), None 表示永不过期
+CATALOG_CACHE_TTL = 6 * 60 * 60
+SEARCH_CACHE_TTL = 10 * 60
+# 公告发布后不会再修改
+POST_DETAIL_CACHE_TTL = None
+# 超过这个时间的图片用 ETag / Last-Modified 重新验证, None 表示不再验证
+IMAGE_REVALIDATE_TTL = 7 * 24 * 60 * 60
+
+# 搜索时依次尝试的每页数量, 使用接口接受的最大值
+SEARCH_PAGE_SIZES = (100, 50, 20)
+
+# 并发获取帖子详情的线程数, 同时也是连接池大小
+MAX_WORKERS = 8
+
+# 库街区接口的限流: 初始每秒请求数和突发数量; 速率和并发数 (从 2 开始) 根据延迟和
+# 429/5xx 自动调整, 分别不超过 KUROBBS_MAX_RATE 和 KUROBBS_MAX_CONCURRENCY
+# (并发数实际还受线程数限制)
+KUROBBS_API_HOST = "api.kurobbs.com"
+KUROBBS_RATE_LIMIT = 20
+KUROBBS_MAX_RATE = 100
+KUROBBS_BURST = 20
+KUROBBS_MAX_CONCURRENCY = 16
+# 连接错误、429、5xx 和接口返回错误码时的重试次数, 以及退避时间的基数和上限 (秒)
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 30
+
+# --watch 时检查新公告的默认间隔, 以及接口出错后的最长等待时间 (秒)
+WATCH_INTERVAL = 10 * 60
+WATCH_MAX_BACKOFF = 2 * 60 * 60
+
+# 流式获取时已解析的卡池, 保存成功后删除
+CHECKPOINT_PATH = CACHE_DIR / "pool_checkpoint.jsonl"
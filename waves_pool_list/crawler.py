@@ -0,0 +1,284 @@
+"""
+搜索卡池公告并获取卡池列表
+"""
+
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
+from .catalog import get_catalog
+from .config import MAX_WORKERS, SEARCH_CACHE_TTL, SEARCH_PAGE_SIZES
+from .fixed import FIXED_POOL_LIST
+from .images import strip_images
+from .kurobbs import (
+    POST_PAGE_URL,
+    cached_search_pool_list,
+    get_post_detail,
+    is_server_error,
+    is_success,
+    search_pool_list,
+)
+from .metrics import metrics
+from .parser import parse_pool
+from .storage import load_pool_list
+from .timeline import add_timestamps, strip_timestamps
+
+
+def filter_post_list(
+    post_list: list[dict[str, Any]],
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+) -> list[dict[str, Any]]:
+    """筛选出官方发布的卡池公告帖子"""
+    result = []
+    for post in post_list:
+        post_id = post["postId"]
+        post_title = post["postTitle"]
+        user_id = post["userId"]
+        if user_id != "10012001":
+            continue
+
+        if keyword not in post_title:
+            continue
+        if "周年" in post_title:
+            continue
+        if not post["imgContent"]:
+            print(f"没有图片: {post_id} {post_title}")
+            continue
+        result.append(post)
+    return result
+
+
+def get_post_id(bbs: str) -> str:
+    """从帖子链接中取出 postId"""
+    return bbs.removeprefix(POST_PAGE_URL)
+
+
+def index_pool_list(pool_list: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """按 postId 索引卡池, 没有帖子链接的卡池不参与索引"""
+    index: dict[str, list[dict[str, Any]]] = {}
+    for pool in pool_list:
+        if not pool["bbs"]:
+            continue
+        index.setdefault(get_post_id(pool["bbs"]), []).append(pool)
+    return index
+
+
+@metrics.stage("search")
+def search_page(
+    page: int,
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    page_sizes: tuple[int, ...] = SEARCH_PAGE_SIZES,
+    ttl: float | None = SEARCH_CACHE_TTL,
+) -> tuple[dict[str, Any], int]:
+    """
+    搜索一页, 返回搜索结果和使用的每页数量
+
+    从大到小尝试 page_sizes, 接口拒绝某个每页数量时换下一个; 限流或服务器错误
+    不是每页数量的问题, 直接抛出异常. ttl 为 0 时不使用缓存的结果
+    """
+    rejected = []
+    for page_size in page_sizes:
+        res = search_pool_list(page, page_size, keyword, ttl=ttl)
+        if is_success(res):
+            return res, page_size
+        if is_server_error(res):
+            raise ValueError(f"搜索失败: {res}")
+        print(f"每页{page_size}个搜索失败: {res.get('msg')}")
+        rejected.append(res)
+    raise ValueError(f"搜索失败: {rejected}")
+
+
+def has_next_page(
+    post_data: dict[str, Any],
+    page: int,
+    count: int,
+    page_size: int,
+) -> bool:
+    """根据搜索结果判断是否还有下一页"""
+    if not count:
+        return False
+    if "hasNext" in post_data:
+        return bool(post_data["hasNext"])
+    for key in ("total", "totalCount"):
+        if key in post_data:
+            return page * page_size < int(post_data[key])
+    if "totalPage" in post_data:
+        return page < int(post_data["totalPage"])
+    # 没有总数时, 不满一页就是最后一页
+    return count >= page_size
+
+
+def first_page_ttl(
+    previous: tuple[float, dict[str, Any]] | None,
+    res: dict[str, Any],
+    ttl: float | None,
+) -> float | None:
+    """
+    之后的页使用的缓存有效期
+
+    公告按发布时间倒序排列, 第一页与之前缓存的第一页相同时, 说明从那时起没有新帖子,
+    在那之后缓存的其他页仍然有效, 有效期延长到那时; 否则使用原来的有效期
+    """
+    if previous is None or not ttl:
+        return ttl
+    stored_at, previous_res = previous
+    if post_ids(previous_res) != post_ids(res):
+        return ttl
+    return max(ttl, time.time() - stored_at)
+
+
+def post_ids(res: dict[str, Any]) -> list[str]:
+    return [post["postId"] for post in res["data"]["post"]["postList"]]
+
+
+def iter_search_pages(
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    end_page: int | None = None,
+    known_post_ids: set[str] | None = None,
+    ttl: float | None = SEARCH_CACHE_TTL,
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """
+    翻页搜索卡池公告, 逐页返回筛选后的帖子, 直到最后一页或 end_page
+
+    处理当前页时已经在后台请求下一页. 每页数量在第一页确定, 之后的页使用相同的值.
+    传入 known_post_ids 时为增量模式: 只返回新帖子,
+    某一页中有卡池公告且都已获取时停止翻页. ttl 为 0 时不使用缓存的搜索结果,
+    否则第一页没有变化时之后的页可以使用过期的缓存, 见 first_page_ttl
+    """
+    page_size = 0
+    # 请求第一页前记下之前缓存的第一页, 请求后缓存会被覆盖
+    previous = (
+        {size: cached_search_pool_list(1, size, keyword) for size in SEARCH_PAGE_SIZES}
+        if ttl
+        else {}
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = 1
+        future = executor.submit(search_page, page, keyword, ttl=ttl)
+        while future is not None:
+            res, requested_size = future.result()
+            page_sizes = (requested_size,)
+            print(f"当前第{page}页")
+            post_data = res["data"]["post"]
+            postList = post_data["postList"]
+            page_posts = filter_post_list(postList, keyword)
+            if page == 1:
+                # 第一页不满时无法区分是结果不足还是接口限制了数量,
+                # 以第一页实际返回的数量作为每页数量, 没有总数时会再看一页
+                page_size = min(requested_size, len(postList)) or requested_size
+                ttl = first_page_ttl(previous.get(requested_size), res, ttl)
+            has_next = has_next_page(post_data, page, len(postList), page_size)
+
+            if known_post_ids is not None and page_posts:
+                new_posts = [
+                    post for post in page_posts if post["postId"] not in known_post_ids
+                ]
+                # 只有用户帖子的页面不能说明后面没有新公告, 继续翻页
+                if not new_posts:
+                    print(f"第{page}页的公告都已获取, 停止翻页")
+                    return
+                page_posts = new_posts
+
+            future = None
+            if has_next and (end_page is None or page < end_page):
+                future = executor.submit(
+                    search_page, page + 1, keyword, page_sizes, ttl=ttl
+                )
+            yield page, page_posts
+            page += 1
+
+
+def search_posts(
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    end_page: int | None = None,
+    known_post_ids: set[str] | None = None,
+    ttl: float | None = SEARCH_CACHE_TTL,
+) -> list[dict[str, Any]]:
+    posts = []
+    for _, page_posts in iter_search_pages(keyword, end_page, known_post_ids, ttl):
+        posts.extend(page_posts)
+    return posts
+
+
+def fetch_post_details(
+    post_ids: list[str],
+    max_workers: int = MAX_WORKERS,
+) -> list[dict[str, Any]]:
+    """并发获取帖子详情, executor.map 按提交顺序返回结果, 保证输出顺序稳定"""
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(get_post_detail, post_ids))
+    return [get_post_detail(post_id) for post_id in post_ids]
+
+
+def get_pool_list(
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    end_page: int | None = None,
+    max_workers: int = MAX_WORKERS,
+    known_post_ids: set[str] | None = None,
+    search_ttl: float | None = SEARCH_CACHE_TTL,
+):
+    """
+    获取卡池列表
+
+    传入 known_post_ids 时为增量模式: 只返回新帖子的卡池
+    """
+    posts = search_posts(keyword, end_page, known_post_ids, search_ttl)
+    post_details = fetch_post_details([post["postId"] for post in posts], max_workers)
+
+    catalog = get_catalog()
+    pool_list = [
+        parse_pool(post, post_detail, catalog)
+        for post, post_detail in zip(posts, post_details)
+    ]
+    return pool_list
+
+
+@metrics.stage("sort")
+def sort_pool_list(pool_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    补充时间戳后按结束时间排序
+
+    时间解析失败时直接抛出异常, 不写入没有时间戳的卡池列表
+    """
+    return sorted(add_timestamps(pool_list), key=lambda x: x["end_timestamp"])
+
+
+def load_known_pools(
+    incremental: bool,
+) -> tuple[list[dict[str, Any]], set[str] | None]:
+    """增量模式下返回 pool.json 中已有的卡池 (不含固定卡池) 和已知的 postId"""
+    if not incremental:
+        return [], None
+    # 时间戳在排序时重新计算; 镜像图片的字段同样去掉, 使用 --mirror 时
+    # mirror_images 为所有卡池重新加上, 否则新旧卡池都没有这些字段
+    old_pool_list = [strip_images(strip_timestamps(pool)) for pool in load_pool_list()]
+    known_post_ids = set(index_pool_list(old_pool_list))
+    # 固定卡池每次都会重新加入
+    old_pool_list = [pool for pool in old_pool_list if pool not in FIXED_POOL_LIST]
+    return old_pool_list, known_post_ids
+
+
+def crawl(
+    incremental: bool = False,
+    end_page: int | None = None,
+    max_workers: int = MAX_WORKERS,
+    search_ttl: float | None = SEARCH_CACHE_TTL,
+) -> list[dict[str, Any]]:
+    """
+    获取完整的卡池列表, 包含固定卡池, 按结束时间排序
+
+    增量模式下只获取 pool.json 中没有的帖子, 已有的卡池原样保留;
+    search_ttl 为 0 时不使用缓存的搜索结果
+    """
+    old_pool_list, known_post_ids = load_known_pools(incremental)
+    character_pool_list = get_pool_list(
+        "角色活动唤取", end_page, max_workers, known_post_ids, search_ttl
+    )
+    weapon_pool_list = get_pool_list(
+        "武器活动唤取", end_page, max_workers, known_post_ids, search_ttl
+    )
+
+    pool_list = FIXED_POOL_LIST + old_pool_list + character_pool_list + weapon_pool_list
+    return sort_pool_list(pool_list)
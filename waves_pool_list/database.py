@@ -0,0 +1,244 @@
+"""
+SQLite 存储
+
+卡池按帖子保存, 同一帖子的卡池一起更新; JSON 文件由数据库导出:
+
+    with PoolDatabase() as db:
+        db.sync(pool_list)
+        db.export()
+        db.by_item("1404")
+"""
+
+import json
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from .catalog import Catalog
+from .config import (
+    CHANGELOG_PATH,
+    COMPRESSED_POOL_LIST_PATH,
+    DATABASE_PATH,
+    MANIFEST_PATH,
+    POOL_LIST_PATH,
+    SHARD_DIR,
+)
+from .crawler import get_post_id
+from .metrics import metrics
+from .storage import save_pool_list
+from .timeline import TimeLike, add_timestamps, to_timestamp
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pools (
+    id INTEGER PRIMARY KEY,
+    -- 固定卡池没有帖子, post_id 为空字符串
+    post_id TEXT NOT NULL,
+    -- 在同一帖子中的顺序
+    post_index INTEGER NOT NULL,
+    -- 在导出的卡池列表中的顺序
+    position INTEGER NOT NULL,
+    pool_type TEXT NOT NULL,
+    start_timestamp INTEGER NOT NULL,
+    end_timestamp INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (post_id, post_index)
+);
+CREATE INDEX IF NOT EXISTS pools_pool_type ON pools (pool_type);
+CREATE INDEX IF NOT EXISTS pools_time ON pools (end_timestamp, start_timestamp);
+
+CREATE TABLE IF NOT EXISTS pool_items (
+    pool_id INTEGER NOT NULL REFERENCES pools (id) ON DELETE CASCADE,
+    item_id TEXT NOT NULL,
+    -- 5 或 4, 表示 UP 的星级
+    star INTEGER NOT NULL,
+    PRIMARY KEY (pool_id, star, item_id)
+);
+CREATE INDEX IF NOT EXISTS pool_items_item_id ON pool_items (item_id);
+
+CREATE TABLE IF NOT EXISTS catalog (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    -- character 或 weapon
+    kind TEXT NOT NULL,
+    star INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS catalog_name ON catalog (name);
+"""
+
+
+def dump_pool(pool: dict[str, Any]) -> str:
+    return json.dumps(pool, ensure_ascii=False, separators=(",", ":"))
+
+
+class PoolDatabase:
+    def __init__(self, path: Path | str = DATABASE_PATH):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "PoolDatabase":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _delete_post(self, post_id: str):
+        self.connection.execute("DELETE FROM pools WHERE post_id = ?", (post_id,))
+
+    def _insert_pools(self, post_id: str, pools: list[tuple[int, dict[str, Any]]]):
+        for post_index, (position, pool) in enumerate(pools):
+            cursor = self.connection.execute(
+                "INSERT INTO pools (post_id, post_index, position, pool_type,"
+                " start_timestamp, end_timestamp, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    post_id,
+                    post_index,
+                    position,
+                    pool["pool_type"],
+                    pool["start_timestamp"],
+                    pool["end_timestamp"],
+                    dump_pool(pool),
+                ),
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO pool_items (pool_id, item_id, star)"
+                " VALUES (?, ?, ?)",
+                [(cursor.lastrowid, item_id, 5) for item_id in pool["five_star_ids"]]
+                + [(cursor.lastrowid, item_id, 4) for item_id in pool["four_star_ids"]],
+            )
+
+    def upsert_post(self, post_id: str, pool_list: list[dict[str, Any]]):
+        """替换一个帖子的所有卡池, 卡池需要已有时间戳"""
+        with self.connection:
+            position = self.connection.execute(
+                "SELECT COALESCE(MAX(position), -1) FROM pools"
+            ).fetchone()[0]
+            self._delete_post(post_id)
+            self._insert_pools(
+                post_id,
+                [(position + 1 + i, pool) for i, pool in enumerate(pool_list)],
+            )
+
+    @metrics.stage("database")
+    def sync(self, pool_list: list[dict[str, Any]]) -> dict[str, int]:
+        """
+        使数据库中的卡池与 pool_list 一致, 只写入有变化的帖子
+
+        返回写入、删除的帖子数量和只更新了顺序的卡池数量
+        """
+        if pool_list and "end_timestamp" not in pool_list[0]:
+            pool_list = add_timestamps(pool_list)
+
+        posts: dict[str, list[tuple[int, dict[str, Any]]]] = defaultdict(list)
+        for position, pool in enumerate(pool_list):
+            posts[get_post_id(pool["bbs"])].append((position, pool))
+
+        existing: dict[str, list[tuple[int, int, str]]] = defaultdict(list)
+        for row in self.connection.execute(
+            "SELECT post_id, id, position, data FROM pools ORDER BY post_id, post_index"
+        ):
+            existing[row[0]].append(row[1:])
+
+        result = {"written": 0, "deleted": 0, "moved": 0}
+        with self.connection:
+            for post_id in existing.keys() - posts.keys():
+                self._delete_post(post_id)
+                result["deleted"] += 1
+
+            for post_id, pools in posts.items():
+                rows = existing.get(post_id, [])
+                if [data for _, _, data in rows] != [
+                    dump_pool(pool) for _, pool in pools
+                ]:
+                    self._delete_post(post_id)
+                    self._insert_pools(post_id, pools)
+                    result["written"] += 1
+                    continue
+                for (pool_id, old_position, _), (position, _) in zip(rows, pools):
+                    if old_position != position:
+                        self.connection.execute(
+                            "UPDATE pools SET position = ? WHERE id = ?",
+                            (position, pool_id),
+                        )
+                        result["moved"] += 1
+        return result
+
+    def save_catalog(self, catalog: Catalog):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO catalog (id, name, kind, star) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET"
+                " name = excluded.name, kind = excluded.kind, star = excluded.star",
+                catalog.table.rows(),
+            )
+
+    def item_name(self, item_id: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT name FROM catalog WHERE id = ?", (item_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def item_id(self, name: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT id FROM catalog WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _query(self, where: str = "", params: tuple = ()) -> list[dict[str, Any]]:
+        rows = self.connection.execute(
+            f"SELECT data FROM pools {where} ORDER BY end_timestamp, position",
+            params,
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def pool_list(self) -> list[dict[str, Any]]:
+        """按结束时间排序的完整卡池列表, 与 pool.json 相同"""
+        return self._query()
+
+    def by_item(self, item_id: str, star: int | None = None) -> list[dict[str, Any]]:
+        """UP 中包含 item_id 的卡池, star 为 5 或 4 时只查对应星级"""
+        if star is None:
+            return self._query(
+                "WHERE id IN (SELECT pool_id FROM pool_items WHERE item_id = ?)",
+                (item_id,),
+            )
+        return self._query(
+            "WHERE id IN (SELECT pool_id FROM pool_items WHERE item_id = ? AND star = ?)",
+            (item_id, star),
+        )
+
+    def by_pool_type(self, pool_type: str) -> list[dict[str, Any]]:
+        return self._query("WHERE pool_type = ?", (pool_type,))
+
+    def overlapping(self, start: TimeLike, end: TimeLike) -> list[dict[str, Any]]:
+        """与 [start, end] 有交集的卡池"""
+        return self._query(
+            "WHERE end_timestamp >= ? AND start_timestamp <= ?",
+            (to_timestamp(start), to_timestamp(end)),
+        )
+
+    def active_at(self, when: TimeLike) -> list[dict[str, Any]]:
+        return self.overlapping(when, when)
+
+    def export(
+        self,
+        path: Path = POOL_LIST_PATH,
+        compressed_path: Path = COMPRESSED_POOL_LIST_PATH,
+        manifest_path: Path = MANIFEST_PATH,
+        changelog_path: Path = CHANGELOG_PATH,
+        shard_dir: Path | None = SHARD_DIR,
+    ) -> bool:
+        """把数据库中的卡池导出为 pool.json 和 compressed_pool.json, 返回是否写入"""
+        return save_pool_list(
+            self.pool_list(),
+            path,
+            compressed_path,
+            manifest_path,
+            changelog_path,
+            shard_dir,
+        )
@@ -0,0 +1,291 @@
+"""
+无法从公告中获取的卡池, 每次运行都会加入卡池列表
+"""
+
+FIXED_POOL_LIST = [
+    {
+        "bbs": "",
+        "name": "忌炎",
+        "title": "夜将寒色去",
+        "pic": "",
+        "five_star_ids": ["1404"],
+        "five_star_names": ["忌炎"],
+        "four_star_ids": ["1602", "1202", "1204"],
+        "four_star_names": ["丹瑾", "炽霞", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2024-05-23 10:00:00",
+        "end_time": "2024-06-13 09:59:59",
+    },
+    {
+        "bbs": "",
+        "name": "苍鳞千嶂",
+        "title": "浮声沉兵",
+        "pic": "",
+        "five_star_ids": ["21010016"],
+        "five_star_names": ["苍鳞千嶂"],
+        "four_star_ids": ["21010044", "21050024", "21040064"],
+        "four_star_names": ["永夜长明", "奇幻变奏", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2024-05-23 10:00:00",
+        "end_time": "2024-06-13 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "忌炎",
+        "title": "夜将寒色去",
+        "pic": "",
+        "five_star_ids": ["1404"],
+        "five_star_names": ["忌炎"],
+        "four_star_ids": ["1504", "1601", "1303"],
+        "four_star_names": ["灯灯", "桃祈", "渊武"],
+        "pool_type": "角色活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "苍鳞千嶂",
+        "title": "浮声沉兵",
+        "pic": "",
+        "five_star_ids": ["21010016"],
+        "five_star_names": ["苍鳞千嶂"],
+        "four_star_ids": ["21010044", "21020024", "21040064"],
+        "four_star_names": ["永夜长明", "行进序曲", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "吟霖",
+        "title": "惊霆雨时节",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/a8332d4349a94bb6a908b972fb7561ff20240605.jpg",
+        "five_star_ids": ["1302"],
+        "five_star_names": ["吟霖"],
+        "four_star_ids": ["1504", "1601", "1303"],
+        "four_star_names": ["灯灯", "桃祈", "渊武"],
+        "pool_type": "角色活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "掣傀之手",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/45eb3783e4db4a02960287f71052f84a20240605.jpg",
+        "five_star_ids": ["21050016"],
+        "five_star_names": ["掣傀之手"],
+        "four_star_ids": ["21010044", "21020024", "21040064"],
+        "four_star_names": ["永夜长明", "行进序曲", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "折枝",
+        "title": "赋彩作长吟",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/e99d94b4cae44f96bb9bb5fc07ca614420240814.jpg",
+        "five_star_ids": ["1105"],
+        "five_star_names": ["折枝"],
+        "four_star_ids": ["1504", "1601", "1303"],
+        "four_star_names": ["灯灯", "桃祈", "渊武"],
+        "pool_type": "角色活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "琼枝冰绡",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/b5db920911c64bbd854da0e7eeb0971820240814.jpg",
+        "five_star_ids": ["21050026"],
+        "five_star_names": ["琼枝冰绡"],
+        "four_star_ids": ["21010044", "21020024", "21040064"],
+        "four_star_names": ["永夜长明", "行进序曲", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "相里要",
+        "title": "千机逐星野",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/2db86470f9314a569650e9fff0433e1f20240905.jpg",
+        "five_star_ids": ["1305"],
+        "five_star_names": ["相里要"],
+        "four_star_ids": ["1504", "1601", "1303"],
+        "four_star_names": ["灯灯", "桃祈", "渊武"],
+        "pool_type": "角色活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "诸方玄枢",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/ec625fec55314e52a5948e9f6641f76220240905.jpg",
+        "five_star_ids": ["21040016"],
+        "five_star_names": ["诸方玄枢"],
+        "four_star_ids": ["21010044", "21020024", "21040064"],
+        "four_star_names": ["永夜长明", "行进序曲", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "菲比",
+        "title": "于静谧呢喃",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/fa562ac0802746dd8028a0959762740b20250211.jpg",
+        "five_star_ids": ["1506"],
+        "five_star_names": ["菲比"],
+        "four_star_ids": ["1504", "1601", "1303"],
+        "four_star_names": ["灯灯", "桃祈", "渊武"],
+        "pool_type": "角色活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1366076768541614080",
+        "name": "和光回唱",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/c41e43ff812340ca9a8134528c00d3c820250211.jpg",
+        "five_star_ids": ["21050046"],
+        "five_star_names": ["和光回唱"],
+        "four_star_ids": ["21010044", "21020024", "21040064"],
+        "four_star_names": ["永夜长明", "行进序曲", "骇行"],
+        "pool_type": "武器活动唤取",
+        "start_time": "版本更新时间",
+        "end_time": "2025-05-22 09:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "title": "寒尽觉春生",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/02bca2fb7f5640ac96eb9490ab71683020240626.jpg",
+        "five_star_ids": ["1304"],
+        "five_star_names": ["今汐"],
+        "four_star_ids": ["1602", "1402", "1204"],
+        "four_star_names": ["丹瑾", "秧秧", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "时和岁稔",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/fb2df4dc9f234cf0a9a1bc867d218b4920240626.jpg",
+        "five_star_ids": ["21010026"],
+        "five_star_names": ["时和岁稔"],
+        "four_star_ids": ["21030044", "21050024", "21030084"],
+        "four_star_names": ["无眠烈火", "奇幻变奏", "悖论喷流"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "长离",
+        "title": "炽羽策阵星",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/c4bd99020c3a4c52982ad301e514690220240719.jpg",
+        "five_star_ids": ["1205"],
+        "five_star_names": ["长离"],
+        "four_star_ids": ["1602", "1402", "1204"],
+        "four_star_names": ["丹瑾", "秧秧", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "赫奕流明",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/a082d6c12f8543219c6b85a69366ce5320240719.jpg",
+        "five_star_ids": ["21020016"],
+        "five_star_names": ["赫奕流明"],
+        "four_star_ids": ["21030044", "21050024", "21030084"],
+        "four_star_names": ["无眠烈火", "奇幻变奏", "悖论喷流"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "珂莱塔",
+        "title": "另一种喧嚣",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/69f3c4ea4fbd4c939524a25a13e0975f20241231.jpg",
+        "five_star_ids": ["1107"],
+        "five_star_names": ["珂莱塔"],
+        "four_star_ids": ["1602", "1402", "1204"],
+        "four_star_names": ["丹瑾", "秧秧", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "死与舞",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/8ec64b37bbb74da38d21054de2ae30b420241231.jpg",
+        "five_star_ids": ["21030016"],
+        "five_star_names": ["死与舞"],
+        "four_star_ids": ["21030044", "21050024", "21030084"],
+        "four_star_names": ["无眠烈火", "奇幻变奏", "悖论喷流"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "洛可可",
+        "title": "箱中舞台",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/0dc5a2a1b5d748a7800ce306164f98ee20250121.jpg",
+        "five_star_ids": ["1606"],
+        "five_star_names": ["洛可可"],
+        "four_star_ids": ["1602", "1402", "1204"],
+        "four_star_names": ["丹瑾", "秧秧", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "悲喜剧",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/2ebb015eace4456c814248fc0093d88720250121.jpg",
+        "five_star_ids": ["21040026"],
+        "five_star_names": ["悲喜剧"],
+        "four_star_ids": ["21030044", "21050024", "21030084"],
+        "four_star_names": ["无眠烈火", "奇幻变奏", "悖论喷流"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "布兰特",
+        "title": "燃焰于海",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/726fc80c40194adca0d314a27b4620ed20250304.jpeg",
+        "five_star_ids": ["1206"],
+        "five_star_names": ["布兰特"],
+        "four_star_ids": ["1602", "1402", "1204"],
+        "four_star_names": ["丹瑾", "秧秧", "莫特斐"],
+        "pool_type": "角色活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+    {
+        "bbs": "https://www.kurobbs.com/mc/post/1374001519726297088",
+        "name": "不灭航路",
+        "title": "浮声沉兵",
+        "pic": "https://prod-alicdn-community.kurobbs.com/forum/6d868f660f224f168d5c020c77d5a11020250304.jpeg",
+        "five_star_ids": ["21020036"],
+        "five_star_names": ["不灭航路"],
+        "four_star_ids": ["21030044", "21050024", "21030084"],
+        "four_star_names": ["无眠烈火", "奇幻变奏", "悖论喷流"],
+        "pool_type": "武器活动唤取",
+        "start_time": "2025-05-22 10:00:00",
+        "end_time": "2025-06-11 11:59:59",
+    },
+]
@@ -0,0 +1,252 @@
+"""
+卡池图片镜像
+
+把卡池的 pic 下载到 data/images, 文件名为内容的 sha256, 复刻卡池使用相同图片时只保存一份.
+index.json 记录每个图片链接对应的文件、尺寸和 ETag / Last-Modified:
+IMAGE_REVALIDATE_TTL 内不再请求, 超过后发送条件请求, 返回 304 时不重新下载.
+
+镜像后的卡池在 pic 之后加上:
+
+    "pic_path": "images/<sha256>.jpeg",  # 相对于 data 目录
+    "pic_width": 1920,
+    "pic_height": 1080,
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import urlsplit
+
+from .client import get_session
+from .config import (
+    DATA_PATH,
+    IMAGE_DIR,
+    IMAGE_INDEX_PATH,
+    IMAGE_REVALIDATE_TTL,
+    MAX_WORKERS,
+)
+from .metrics import metrics
+from .storage import write_atomic
+
+IMAGE_KEYS = ("pic_path", "pic_width", "pic_height")
+IMAGE_EXTENSIONS = {"jpeg": ".jpeg", "png": ".png", "gif": ".gif", "webp": ".webp"}
+# 内容寻址的文件名, 清理时只删除这类文件
+IMAGE_NAME = re.compile(r"[0-9a-f]{64}\.\w+")
+
+# 多个链接可能指向相同内容, 写入同一个文件时加锁
+_write_lock = threading.Lock()
+
+
+def jpeg_size(content: bytes) -> tuple[int, int] | None:
+    """从 SOF 段读取尺寸"""
+    i = 2
+    while i + 9 <= len(content):
+        if content[i] != 0xFF:
+            return None
+        marker = content[i + 1]
+        if marker == 0xFF:
+            # 段之间的填充字节
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            i += 2
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = int.from_bytes(content[i + 5 : i + 7], "big")
+            width = int.from_bytes(content[i + 7 : i + 9], "big")
+            return width, height
+        i += 2 + int.from_bytes(content[i + 2 : i + 4], "big")
+    return None
+
+
+def webp_size(content: bytes) -> tuple[int, int] | None:
+    chunk = content[12:16]
+    if chunk == b"VP8 " and content[23:26] == b"\x9d\x01\x2a":
+        width = int.from_bytes(content[26:28], "little") & 0x3FFF
+        height = int.from_bytes(content[28:30], "little") & 0x3FFF
+        return width, height
+    if chunk == b"VP8L" and content[20] == 0x2F:
+        bits = int.from_bytes(content[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(content[24:27], "little") + 1
+        height = int.from_bytes(content[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def image_size(content: bytes) -> tuple[str, int | None, int | None]:
+    """
+    返回图片格式和尺寸, 只读取文件头, 不需要图片库
+
+    无法识别的格式返回 ("", None, None), 无法读取尺寸时尺寸为 None
+    """
+    size = None
+    if content.startswith(b"\xff\xd8"):
+        kind, size = "jpeg", jpeg_size(content)
+    elif content.startswith(b"\x89PNG\r\n\x1a\n"):
+        kind = "png"
+        size = (
+            int.from_bytes(content[16:20], "big"),
+            int.from_bytes(content[20:24], "big"),
+        )
+    elif content[:6] in (b"GIF87a", b"GIF89a"):
+        kind = "gif"
+        size = (
+            int.from_bytes(content[6:8], "little"),
+            int.from_bytes(content[8:10], "little"),
+        )
+    elif content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        kind, size = "webp", webp_size(content)
+    else:
+        return "", None, None
+    width, height = size or (None, None)
+    return kind, width, height
+
+
+def load_image_index(path: Path = IMAGE_INDEX_PATH) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def strip_images(pool: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in pool.items() if key not in IMAGE_KEYS}
+
+
+def with_image(pool: dict[str, Any], entry: dict[str, Any] | None) -> dict[str, Any]:
+    """返回在 pic 之后加上本地路径和尺寸的卡池, entry 为 None 时去掉这些字段"""
+    result = {}
+    for key, value in pool.items():
+        if key in IMAGE_KEYS:
+            continue
+        result[key] = value
+        if key == "pic" and entry is not None:
+            result.update(
+                pic_path=entry["path"],
+                pic_width=entry["width"],
+                pic_height=entry["height"],
+            )
+    return result
+
+
+def store_image(
+    url: str, content: bytes, image_dir: Path, base_dir: Path
+) -> dict[str, Any]:
+    """按内容哈希保存图片, 已有相同内容的文件时不再写入"""
+    digest = hashlib.sha256(content).hexdigest()
+    kind, width, height = image_size(content)
+    suffix = IMAGE_EXTENSIONS.get(kind) or PurePosixPath(urlsplit(url).path).suffix
+    path = image_dir / f"{digest}{suffix or '.bin'}"
+    with _write_lock:
+        if not path.exists():
+            write_atomic(path, content)
+    return {
+        "path": path.relative_to(base_dir).as_posix(),
+        "hash": f"sha256:{digest}",
+        "size": len(content),
+        "width": width,
+        "height": height,
+    }
+
+
+def fetch_image(
+    url: str,
+    entry: dict[str, Any] | None,
+    image_dir: Path,
+    base_dir: Path,
+    ttl: float | None,
+) -> tuple[str, dict[str, Any] | None]:
+    """
+    返回 (结果, 新的索引记录), 结果为 hit / revalidated / miss / failed
+
+    本地文件存在且未超过 ttl 时不请求; 否则带上 ETag / Last-Modified 发送条件请求.
+    请求失败时保留原来的记录
+    """
+    if entry is not None and not (base_dir / entry["path"]).exists():
+        entry = None
+    now = time.time()
+    if entry is not None and (ttl is None or now - entry["checked_at"] < ttl):
+        metrics.record_cache(url, "hit")
+        return "hit", entry
+
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        res = get_session().get(url, headers=headers, timeout=10)
+        if res.status_code == 304 and entry is not None:
+            metrics.record_cache(url, "revalidated")
+            return "revalidated", {**entry, "checked_at": now}
+        res.raise_for_status()
+        stored = store_image(url, res.content, image_dir, base_dir)
+    except Exception as e:
+        print(f"下载图片失败: {url} {e}")
+        return "failed", entry
+    metrics.record_cache(url, "miss")
+    return "miss", {
+        **stored,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "checked_at": now,
+    }
+
+
+def prune_images(image_dir: Path, index: dict[str, dict[str, Any]], base_dir: Path):
+    """删除索引中不再引用的图片文件"""
+    if not image_dir.exists():
+        return
+    used = {base_dir / entry["path"] for entry in index.values()}
+    for path in image_dir.iterdir():
+        if IMAGE_NAME.fullmatch(path.name) and path not in used:
+            path.unlink()
+
+
+@metrics.stage("mirror")
+def mirror_images(
+    pool_list: list[dict[str, Any]],
+    image_dir: Path = IMAGE_DIR,
+    index_path: Path = IMAGE_INDEX_PATH,
+    base_dir: Path = DATA_PATH,
+    max_workers: int = MAX_WORKERS,
+    ttl: float | None = IMAGE_REVALIDATE_TTL,
+) -> list[dict[str, Any]]:
+    """
+    并发下载卡池图片, 返回加上本地路径和尺寸的卡池列表
+
+    相同链接只请求一次; 下载失败且本地没有的图片不加这些字段
+    """
+    index = load_image_index(index_path)
+    urls = sorted({pool["pic"] for pool in pool_list if pool.get("pic")})
+
+    def fetch(url: str) -> tuple[str, str, dict[str, Any] | None]:
+        return (url, *fetch_image(url, index.get(url), image_dir, base_dir, ttl))
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        results = list(executor.map(fetch, urls))
+
+    new_index = {url: entry for url, _, entry in results if entry is not None}
+    if new_index != index:
+        write_atomic(
+            index_path, json.dumps(new_index, indent=4, ensure_ascii=False) + "\n"
+        )
+    prune_images(image_dir, new_index, base_dir)
+
+    counts = {"hit": 0, "revalidated": 0, "miss": 0, "failed": 0}
+    for _, result, _ in results:
+        counts[result] += 1
+    files = len({entry["hash"] for entry in new_index.values()})
+    print(
+        f"图片: {len(urls)} 个链接, {files} 个文件, 下载 {counts['miss']} 个, "
+        f"未变化 {counts['hit'] + counts['revalidated']} 个, 失败 {counts['failed']} 个"
+    )
+    return [with_image(pool, new_index.get(pool.get("pic"))) for pool in pool_list]
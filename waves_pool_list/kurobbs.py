@@ -0,0 +1,137 @@
+"""
+库街区接口
+"""
+
+import json
+from typing import Any, Literal
+
+from .client import get_cache, get_session
+from .config import KUROBBS_API_HOST, POST_DETAIL_CACHE_TTL, SEARCH_CACHE_TTL
+from .metrics import metrics
+from .throttle import RETRY_STATUS, SingleFlight, call_with_retry
+
+GAME_ID = 3
+MAIN_URL = f"https://{KUROBBS_API_HOST}"
+ANN_CONTENT_URL = f"{MAIN_URL}/forum/getPostDetail"
+SEARCH_URL = f"{MAIN_URL}/forum/search/v2/join"
+POST_PAGE_URL = "https://www.kurobbs.com/mc/post/"
+
+headers = {
+    "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36 Edg/132.0.0.0",
+    "Accept": "application/json, text/plain, */*",
+    "Source": "h5",
+    "Token": "",
+    "devcode": "IvYsrF21ls8CMFfxo1CTGQsv8neo0t6x",
+}
+detail_headers = {**headers, "devcode": "", "token": "", "version": ""}
+
+
+def is_success(value: dict[str, Any]) -> bool:
+    """库街区接口返回成功时才缓存"""
+    return value.get("code") == 200
+
+
+def is_server_error(value: dict[str, Any]) -> bool:
+    """接口在响应内容中返回的限流或服务器错误, 与请求参数无关"""
+    return value.get("code") in RETRY_STATUS
+
+
+# 同一帖子的并发请求只发送一次
+_detail_requests = SingleFlight()
+
+
+@metrics.stage("detail")
+def get_post_detail(post_id: str):
+    """
+    获取帖子详情
+
+    请求失败或接口返回错误码时按退避重试 (见 throttle.py),
+    仍然失败时抛出异常, 不会把错误的响应当作帖子详情解析
+    """
+    return _detail_requests.do(post_id, lambda: _fetch_post_detail(post_id))
+
+
+def _fetch_post_detail(post_id: str):
+    res = call_with_retry(
+        lambda: _request_post_detail(post_id),
+        ANN_CONTENT_URL,
+        retry_value=lambda value: not is_success(value),
+    )
+    if not is_success(res):
+        raise ValueError(f"获取帖子详情失败: {post_id} {res.get('msg')}")
+    return res
+
+
+def _request_post_detail(post_id: str):
+    data = {
+        "isOnlyPublisher": 1,
+        "postId": post_id,
+        "showOrderType": 2,
+    }
+    return get_cache().request_json(
+        get_session(),
+        "POST",
+        ANN_CONTENT_URL,
+        ttl=POST_DETAIL_CACHE_TTL,
+        cacheable=is_success,
+        headers=detail_headers,
+        data=data,
+        timeout=10,
+    )
+
+
+def search_data(
+    pageIndex: int,
+    pageSize: int,
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    gameId: int = GAME_ID,
+    search_type: int = 3,
+) -> dict[str, Any]:
+    return {
+        "gameId": gameId,
+        "keyword": keyword,
+        "pageIndex": pageIndex,
+        "pageSize": pageSize,
+        "searchType": search_type,
+    }
+
+
+def search_pool_list(
+    pageIndex: int,
+    pageSize: int,
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+    gameId: int = GAME_ID,
+    search_type: int = 3,
+    ttl: float | None = SEARCH_CACHE_TTL,
+):
+    data = search_data(pageIndex, pageSize, keyword, gameId, search_type)
+    # 每页数量被拒绝等其他错误码交给调用方处理
+    return call_with_retry(
+        lambda: get_cache().request_json(
+            get_session(),
+            "POST",
+            SEARCH_URL,
+            ttl=ttl,
+            cacheable=is_success,
+            headers=headers,
+            data=data,
+            timeout=10,
+        ),
+        SEARCH_URL,
+        retry_value=is_server_error,
+    )
+
+
+def cached_search_pool_list(
+    pageIndex: int,
+    pageSize: int,
+    keyword: Literal["角色活动唤取", "武器活动唤取"],
+) -> tuple[float, dict[str, Any]] | None:
+    """本地缓存中的搜索结果及其缓存时间, 不论是否过期, 不请求网络; 没有缓存时返回 None"""
+    cache = get_cache()
+    if not cache.enabled:
+        return None
+    key = cache.make_key("POST", SEARCH_URL, search_data(pageIndex, pageSize, keyword))
+    entry = cache.get(key)
+    return None if entry is None else (entry.stored_at, json.loads(entry.body))
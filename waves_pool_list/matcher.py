@@ -0,0 +1,93 @@
+"""
+Aho-Corasick 多模式匹配
+
+用角色和武器名称构建自动机, 一次线性扫描找出文本中所有已知名称及其位置,
+匹配时忽略空白字符, 「今汐 」、「今 汐」都能匹配到今汐
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+IGNORED_CHARS = frozenset(" \t\r\n　\xa0")
+
+
+@dataclass
+class NameMatch:
+    start: int
+    end: int
+    name: str
+    id: str
+
+
+class NameMatcher:
+    def __init__(self, name2id: dict[str, str]):
+        self.name2id = name2id
+        # 每个状态的转移, 失败指针, 以及在该状态结束的名称 (按长度从长到短)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, str]]] = [[]]
+
+        for name in name2id:
+            key = "".join(ch for ch in name if ch not in IGNORED_CHARS)
+            if not key:
+                continue
+            state = 0
+            for ch in key:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(key), name))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = sorted(
+                    self._output[next_state] + self._output[self._fail[next_state]],
+                    reverse=True,
+                )
+
+    def iter_matches(self, text: str, start: int = 0, end: int | None = None):
+        """找出 text[start:end] 中所有已知名称, 包括相互重叠的"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        # 已扫描的非空白字符的位置, 用于把名称长度换算回原文位置
+        positions = []
+        state = 0
+        for i in range(start, len(text) if end is None else end):
+            ch = text[i]
+            if ch in IGNORED_CHARS:
+                continue
+            positions.append(i)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, name in output[state]:
+                yield NameMatch(positions[-length], i + 1, name, self.name2id[name])
+
+    def find_all(
+        self, text: str, start: int = 0, end: int | None = None
+    ) -> list[NameMatch]:
+        """找出所有互不重叠的名称, 重叠时取最靠前、最长的"""
+        matches = sorted(
+            self.iter_matches(text, start, end),
+            key=lambda match: (match.start, match.start - match.end),
+        )
+        result = []
+        last_end = -1
+        for match in matches:
+            if match.start >= last_end:
+                result.append(match)
+                last_end = match.end
+        return result
@@ -0,0 +1,165 @@
+"""
+运行指标
+
+记录各阶段耗时、请求数、延迟分布、接收字节数、缓存命中率和重试次数,
+用 report() 导出为 JSON:
+
+    with metrics.stage("search"):
+        ...
+    metrics.report()
+"""
+
+import bisect
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from urllib.parse import urlsplit
+
+# 延迟分布的桶上限 (秒), 最后一个桶是 "+Inf"
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CacheResult = Literal["hit", "miss", "revalidated"]
+
+
+def endpoint_name(url: str) -> str:
+    parts = urlsplit(url)
+    return parts.netloc + parts.path
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    first_start: float = 0.0
+    last_end: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "max": round(self.max, 6),
+            # 并发执行时 total 会超过实际经过的时间, span 是第一次开始到最后一次结束
+            "span": round(self.last_end - self.first_start, 6),
+        }
+
+
+@dataclass
+class RequestStats:
+    count: int = 0
+    errors: int = 0
+    bytes: int = 0
+    latencies: list[float] = field(default_factory=list)
+    status: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict[str, Any]:
+        buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        for latency in self.latencies:
+            buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "status": {str(code): n for code, n in sorted(self.status.items())},
+            "latency": {
+                "p50": round(percentile(self.latencies, 0.5), 6),
+                "p90": round(percentile(self.latencies, 0.9), 6),
+                "p99": round(percentile(self.latencies, 0.99), 6),
+                "max": round(max(self.latencies, default=0.0), 6),
+                "buckets": {
+                    **{str(le): n for le, n in zip(LATENCY_BUCKETS, buckets)},
+                    "+Inf": buckets[-1],
+                },
+            },
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._start = time.perf_counter()
+            self.stages: dict[str, StageStats] = {}
+            self.requests: dict[str, RequestStats] = {}
+            self.cache: dict[str, Counter] = {}
+            self.retries: Counter = Counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                stats = self.stages.get(name)
+                if stats is None:
+                    stats = self.stages[name] = StageStats(first_start=start)
+                stats.count += 1
+                stats.total += end - start
+                stats.max = max(stats.max, end - start)
+                stats.first_start = min(stats.first_start, start)
+                stats.last_end = max(stats.last_end, end)
+
+    def record_request(self, url: str, latency: float, size: int, status_code: int):
+        with self._lock:
+            stats = self.requests.setdefault(endpoint_name(url), RequestStats())
+            stats.count += 1
+            stats.bytes += size
+            stats.latencies.append(latency)
+            stats.status[status_code] += 1
+            if status_code >= 400:
+                stats.errors += 1
+
+    def record_cache(self, url: str, result: CacheResult):
+        with self._lock:
+            self.cache.setdefault(endpoint_name(url), Counter())[result] += 1
+
+    def record_retry(self, url: str):
+        with self._lock:
+            self.retries[endpoint_name(url)] += 1
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            cache = {}
+            for endpoint, counter in self.cache.items():
+                total = sum(counter.values())
+                cache[endpoint] = {
+                    "hit": counter["hit"],
+                    "miss": counter["miss"],
+                    "revalidated": counter["revalidated"],
+                    "hit_rate": round(
+                        (counter["hit"] + counter["revalidated"]) / total, 4
+                    ),
+                }
+            return {
+                "started_at": self.started_at,
+                "wall_time": round(time.perf_counter() - self._start, 6),
+                "stages": {
+                    name: stats.to_dict() for name, stats in self.stages.items()
+                },
+                "requests": {
+                    endpoint: stats.to_dict()
+                    for endpoint, stats in self.requests.items()
+                },
+                "cache": cache,
+                "retries": dict(self.retries),
+            }
+
+
+metrics = Metrics()
@@ -0,0 +1,20 @@
+"""
+角色和武器的 pydantic 模型
+
+导入 pydantic 和构建模型较慢, 只在用到 char_list / weapon_list 时导入,
+catalog.Character / catalog.Weapon 仍然可以访问
+"""
+
+from pydantic import BaseModel
+
+
+class Character(BaseModel):
+    char_id: str
+    char_name: str
+    star: int
+
+
+class Weapon(BaseModel):
+    weapon_id: str
+    weapon_name: str
+    star: int
@@ -0,0 +1,205 @@
+"""
+多语言的角色和武器名称表
+
+所有语言的名称放入同一个字符串表 (sys.intern, 相同名称只保存一份), 每种语言只保存
+一个下标数组; id 和名称的查找都是一次字典访问:
+
+    table = NameTable.from_raw(raw_character_data, raw_weapon_data)
+    table.name("1404", "en")
+    table.id("Jiyan", "en")
+    table.id("忌炎", locale=None)  # 任意语言
+"""
+
+import functools
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+# hakush 数据中的语言, 只保留数据中出现的
+LOCALES = ("zh-Hans", "zh-Hant", "en", "ja", "ko", "fr", "de", "es")
+DEFAULT_LOCALE = "zh-Hans"
+KINDS = ("character", "weapon")
+CHARACTER, WEAPON = 0, 1
+
+
+@functools.cache
+def raw_data_adapters() -> tuple[tuple["TypeAdapter", str], ...]:
+    """
+    校验 hakush 数据的 TypeAdapter 和星级字段, 角色的星级取自 element, 武器取自 rank
+
+    整个文件一次校验, 不为每个角色/武器创建对象. 构建 TypeAdapter 较慢, 第一次使用时才构建
+    """
+    from pydantic import TypeAdapter
+    from typing_extensions import Required, TypedDict
+
+    # 其他语言的名称都是可选的, 可能缺失或为 null
+    locale_fields = {
+        DEFAULT_LOCALE: Required[str],
+        **{locale: str | None for locale in LOCALES if locale != DEFAULT_LOCALE},
+    }
+    raw_character = TypedDict(
+        "RawCharacter", {**locale_fields, "element": Required[int]}, total=False
+    )
+    raw_weapon = TypedDict(
+        "RawWeapon", {**locale_fields, "rank": Required[int]}, total=False
+    )
+    return (
+        (TypeAdapter(dict[str, raw_character]), "element"),
+        (TypeAdapter(dict[str, raw_weapon]), "rank"),
+    )
+
+
+class NameTable:
+    """
+    按行保存的角色和武器, 角色在前
+
+    ids / strings 为 Python 列表, kinds / stars 和每种语言的名称下标为 array,
+    没有该语言名称时下标为 -1
+    """
+
+    def __init__(
+        self,
+        ids: list[str],
+        kinds: list[int],
+        stars: list[int],
+        names: dict[str, list[str | None]],
+    ):
+        strings: dict[str, int] = {}
+
+        def string_index(value: str | None) -> int:
+            if value is None:
+                return -1
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        self.ids = [sys.intern(item_id) for item_id in ids]
+        self.kinds = array("b", kinds)
+        self.stars = array("b", stars)
+        self.locales = tuple(names)
+        self.names = {
+            locale: array("i", map(string_index, values))
+            for locale, values in names.items()
+        }
+        self.strings = [sys.intern(value) for value in strings]
+        self.id_index = {item_id: row for row, item_id in enumerate(self.ids)}
+
+        # 在所有语言中都指向同一行的名称放入 name_index, 其余按 (语言, 名称) 放入 conflicts;
+        # 同一语言中重名时后面的 (武器) 优先, 与原来合并字典的顺序相同
+        rows: dict[str, int] = {}
+        ambiguous = set()
+        for locale in self.locales:
+            for row, index in enumerate(self.names[locale]):
+                if index >= 0:
+                    name = self.strings[index]
+                    if rows.setdefault(name, row) != row:
+                        ambiguous.add(name)
+        self.name_index = {
+            name: row for name, row in rows.items() if name not in ambiguous
+        }
+        self.conflicts = {
+            (locale, self.strings[index]): row
+            for locale in self.locales
+            for row, index in enumerate(self.names[locale])
+            if index >= 0 and self.strings[index] in ambiguous
+        }
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw_character_data: dict[str, Any],
+        raw_weapon_data: dict[str, Any],
+    ) -> "NameTable":
+        ids: list[str] = []
+        kinds: list[int] = []
+        stars: list[int] = []
+        columns: dict[str, list[str | None]] = {locale: [] for locale in LOCALES}
+        for kind, raw_data in enumerate((raw_character_data, raw_weapon_data)):
+            adapter, star_key = raw_data_adapters()[kind]
+            items = adapter.validate_python(raw_data)
+            ids.extend(items)
+            kinds.extend([kind] * len(items))
+            stars.extend(item[star_key] for item in items.values())
+            for locale, column in columns.items():
+                column.extend(item.get(locale) for item in items.values())
+        names = {
+            locale: column
+            for locale, column in columns.items()
+            if any(value is not None for value in column)
+        }
+        return cls(ids, kinds, stars, names)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, item_id: str) -> int | None:
+        return self.id_index.get(item_id)
+
+    def name(self, item_id: str, locale: str = DEFAULT_LOCALE) -> str | None:
+        row = self.id_index.get(item_id)
+        names = self.names.get(locale)
+        if row is None or names is None:
+            return None
+        index = names[row]
+        return self.strings[index] if index >= 0 else None
+
+    def id(self, name: str, locale: str | None = DEFAULT_LOCALE) -> str | None:
+        """名称对应的 id, locale 为 None 时在所有语言中查找"""
+        row = self.name_index.get(name)
+        if row is None:
+            for candidate in self.locales if locale is None else (locale,):
+                row = self.conflicts.get((candidate, name))
+                if row is not None:
+                    return self.ids[row]
+            return None
+        if locale is not None:
+            # 名称存在, 但可能是其他语言的名称
+            names = self.names.get(locale)
+            if names is None or names[row] < 0 or self.strings[names[row]] != name:
+                return None
+        return self.ids[row]
+
+    def id2name(
+        self, locale: str = DEFAULT_LOCALE, kind: int | None = None
+    ) -> dict[str, str]:
+        """某一语言的 {id: 名称}, kind 为 CHARACTER 或 WEAPON 时只包含该类型"""
+        return {
+            item_id: self.strings[index]
+            for item_id, item_kind, index in zip(
+                self.ids, self.kinds, self.names[locale]
+            )
+            if index >= 0 and (kind is None or item_kind == kind)
+        }
+
+    def name2id(
+        self, locale: str = DEFAULT_LOCALE, kind: int | None = None
+    ) -> dict[str, str]:
+        return {name: item_id for item_id, name in self.id2name(locale, kind).items()}
+
+    def rows(self) -> Iterator[tuple[str, str, str, int]]:
+        """(id, 默认语言的名称, 类型, 星级), 与数据库中 catalog 表的列相同"""
+        names = self.names[DEFAULT_LOCALE]
+        for item_id, index, kind, star in zip(self.ids, names, self.kinds, self.stars):
+            yield item_id, self.strings[index], KINDS[kind], star
+
+    def memory_usage(self) -> dict[str, int]:
+        """各部分占用的字节数 (sys.getsizeof, 字符串只计算一次)"""
+        strings = {id(value): value for value in (*self.ids, *self.strings)}
+        usage = {
+            "strings": sum(map(sys.getsizeof, strings.values()))
+            + sys.getsizeof(self.ids)
+            + sys.getsizeof(self.strings),
+            "arrays": sys.getsizeof(self.kinds)
+            + sys.getsizeof(self.stars)
+            + sum(map(sys.getsizeof, self.names.values())),
+            "indexes": sys.getsizeof(self.id_index)
+            + sys.getsizeof(self.name_index)
+            + sys.getsizeof(self.conflicts),
+        }
+        usage["total"] = sum(usage.values())
+        return usage
@@ -0,0 +1,190 @@
+"""
+解析卡池公告的标题和正文
+
+所有正则都预先编译, 与卡池无关的内容块只做子串判断,
+UP 内容块用预先编译的正则分别取出 5 星部分和 4 星部分,
+再用 Catalog 的名称自动机找出其中的角色和武器
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from .catalog import Catalog, get_catalog
+from .kurobbs import POST_PAGE_URL
+from .matcher import IGNORED_CHARS, NameMatcher
+from .metrics import metrics
+
+name_pattern = re.compile(r"「(.*?)」")
+title_pattern_1 = re.compile(r"&lt;(.*?)&gt;")
+title_pattern_2 = re.compile(r"\[(.*?)\]")
+title_pattern_3 = re.compile(r"<(.*?)>")
+
+# 匹配中文格式的日期时间
+time_pattern = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日(\d{1,2}):(\d{1,2})")
+
+# 5星角色「」、4星角色「」「」「」唤取概率提升
+# 5 星和 4 星部分分别匹配, 可以在内容块中的任意位置 (不要求同一行或先后顺序):
+# 5 星部分为 "5星角色" 之后紧跟的「」, 每处都取; 4 星部分为第一处 "4星角色" 之后
+# 到 "唤取" 或行尾的内容
+POOL_TYPES = {"角色": "角色活动唤取", "武器": "武器活动唤取"}
+WHITESPACE = "".join(IGNORED_CHARS)
+RATE_UP_PATTERNS = {
+    kind: (
+        re.compile(rf"5星{kind}(「.*?」)"),
+        re.compile(rf"4星{kind}(.*?)(?=唤取|$)", re.MULTILINE),
+    )
+    for kind in POOL_TYPES
+}
+VERSION_START_TIME = "版本更新时间"
+
+
+@dataclass
+class PostContent:
+    five_star_ids: list[str] = field(default_factory=list)
+    five_star_names: list[str] = field(default_factory=list)
+    four_star_ids: list[str] = field(default_factory=list)
+    four_star_names: list[str] = field(default_factory=list)
+    pool_type: str = ""
+    start_time: str = ""
+    end_time: str = ""
+
+
+def format_time(
+    year: str, month: str, day: str, hour: str, minute: str, second: str
+) -> str:
+    return f"{year}-{month.zfill(2)}-{day.zfill(2)} {hour.zfill(2)}:{minute.zfill(2)}:{second}"
+
+
+def extract_and_convert_time(text: str):
+    matches = time_pattern.findall(text)
+    result = {}
+
+    # 如果找到至少两个匹配项（开始和结束时间）
+    if len(matches) >= 2:
+        result["start_at"] = format_time(*matches[0], "00")
+        result["end_at"] = format_time(*matches[1], "59")
+    elif len(matches) == 1:
+        result["start_at"] = VERSION_START_TIME
+        result["end_at"] = format_time(*matches[0], "59")
+    else:
+        raise ValueError(f"没有找到时间: {text}")
+
+    return result
+
+
+def parse_title(post_title: str) -> tuple[str, str]:
+    """从帖子标题中取出卡池名称和标题"""
+    post_title = post_title.replace("<em>", "").replace("</em>", "")
+
+    names = name_pattern.findall(post_title)
+    name = names[-1] if names else ""
+    for pattern in (title_pattern_1, title_pattern_2, title_pattern_3):
+        find_all = pattern.findall(post_title)
+        if find_all:
+            return name, find_all[0]
+    return name, names[0] if names else ""
+
+
+def match_names(
+    text: str,
+    start: int,
+    end: int,
+    matcher: NameMatcher,
+    ids: list[str],
+    names: list[str],
+):
+    """
+    找出 text[start:end] 中的角色和武器
+
+    「」中的内容 (忽略首尾空白) 必须恰好是一个已知名称, 否则抛出 ValueError,
+    不保存缺少角色或武器的卡池; 「长离·焰羽」不会只匹配到长离
+    """
+    matches = matcher.find_all(text, start, end)
+    spans = {(match.start, match.end) for match in matches}
+    for quoted in name_pattern.finditer(text, start, end):
+        content = quoted.group(1)
+        name_start = quoted.start(1) + len(content) - len(content.lstrip(WHITESPACE))
+        name_end = quoted.end(1) - len(content) + len(content.rstrip(WHITESPACE))
+        if (name_start, name_end) not in spans:
+            raise ValueError(f"未知名称: {content}")
+    for match in matches:
+        ids.append(match.id)
+        names.append(match.name)
+
+
+def parse_content_block(text: str, result: PostContent, matcher: NameMatcher):
+    """解析一个内容块, 把结果合并到 result 中"""
+    # 大部分内容块与卡池无关, 子串判断比正则扫描快得多
+    if "星" in text:
+        for kind, (five_star_pattern, four_star_pattern) in RATE_UP_PATTERNS.items():
+            if f"5星{kind}" not in text or f"4星{kind}" not in text:
+                continue
+            for match in five_star_pattern.finditer(text):
+                match_names(
+                    text,
+                    *match.span(1),
+                    matcher,
+                    result.five_star_ids,
+                    result.five_star_names,
+                )
+            match = four_star_pattern.search(text)
+            if match:
+                match_names(
+                    text,
+                    *match.span(1),
+                    matcher,
+                    result.four_star_ids,
+                    result.four_star_names,
+                )
+            result.pool_type = POOL_TYPES[kind]
+
+    if "服务器时间" in text or " ~ " in text:
+        # 2025年3月6日10:00 ~ 2025年3月26日11:59（服务器时间）
+        # 1.4版本更新后 ~ 2024年12月12日09:59（服务器时间）
+        # 2024年6月6日10:00 ~ 2024年6月26日11:59
+        time_range = extract_and_convert_time(text)
+        result.start_time = time_range["start_at"]
+        result.end_time = time_range["end_at"]
+
+
+def parse_post_content(
+    post_content: list[dict[str, Any]],
+    catalog: Catalog | None = None,
+) -> PostContent:
+    matcher = (catalog or get_catalog()).matcher
+    result = PostContent()
+    for content in post_content:
+        if content["contentType"] != 1:
+            continue
+        parse_content_block(content["content"], result, matcher)
+    return result
+
+
+@metrics.stage("parse")
+def parse_pool(
+    post: dict[str, Any],
+    post_detail: dict[str, Any],
+    catalog: Catalog | None = None,
+) -> dict[str, Any]:
+    """根据搜索结果中的帖子和帖子详情解析出卡池"""
+    name, title = parse_title(post["postTitle"])
+    content = parse_post_content(
+        post_detail["data"]["postDetail"]["postContent"], catalog
+    )
+
+    pool = {
+        "bbs": POST_PAGE_URL + post["postId"],
+        "name": name,
+        "title": title,
+        "pic": post["imgContent"][0]["url"],
+        "five_star_ids": content.five_star_ids,
+        "five_star_names": content.five_star_names,
+        "four_star_ids": content.four_star_ids,
+        "four_star_names": content.four_star_names,
+        "pool_type": content.pool_type,
+        "start_time": content.start_time,
+        "end_time": content.end_time,
+    }
+
+    return pool
@@ -0,0 +1,257 @@
+"""
+流式获取卡池列表
+
+搜索 -> 帖子详情 -> 解析 -> 写入 四个阶段通过有界队列连接, 两个关键词同时搜索,
+每解析出一个卡池就追加到检查点文件, 中途失败时已获取的卡池不会丢失,
+下次运行会从检查点恢复, 只获取剩下的帖子
+"""
+
+import json
+import queue
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .catalog import get_catalog
+from .changelog import pool_key
+from .config import CHECKPOINT_PATH, MAX_WORKERS
+from .crawler import get_post_id, iter_search_pages, load_known_pools, sort_pool_list
+from .fixed import FIXED_POOL_LIST
+from .kurobbs import get_post_detail
+from .parser import parse_pool
+
+KEYWORDS = ("角色活动唤取", "武器活动唤取")
+
+# 队列中表示上游已经结束
+_DONE = object()
+
+# 卡池在完整卡池列表中的顺序: (关键词序号, 页码, 页内序号)
+SortKey = tuple[int, int, int]
+
+
+class _Stages:
+    """管理阶段线程, 任一阶段出错时通知其他阶段停止"""
+
+    def __init__(self):
+        self.stop = threading.Event()
+        self.error: BaseException | None = None
+        self.threads: list[threading.Thread] = []
+
+    def start(self, target: Callable[..., None], *args):
+        def run():
+            try:
+                target(*args)
+            except BaseException as e:
+                if self.error is None:
+                    self.error = e
+                self.stop.set()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self.threads.append(thread)
+        return thread
+
+    def put(self, q: queue.Queue, item: Any) -> bool:
+        """放入队列, 已经停止时返回 False"""
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(self, q: queue.Queue) -> Any:
+        """从队列取出, 已经停止时返回 _DONE"""
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+
+
+def checkpoint_header(incremental: bool, end_page: int | None) -> dict[str, Any]:
+    """检查点文件的第一行, 记录写入时的运行参数"""
+    return {"mode": "incremental" if incremental else "full", "end_page": end_page}
+
+
+def load_checkpoint(
+    path: Path = CHECKPOINT_PATH, header: dict[str, Any] | None = None
+) -> list[tuple[SortKey, dict]] | None:
+    """
+    读取检查点中的卡池
+
+    传入 header 时, 检查点由参数不同的运行写入 (或没有文件头) 则返回 None
+    """
+    if not path.exists():
+        return []
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f):
+            # 写到一半中断的最后一行直接丢弃
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if number == 0:
+                # 第一行为文件头
+                if header is not None and record != header:
+                    return None
+                continue
+            if record is not None:
+                records.append((tuple(record["key"]), record["pool"]))
+    return records
+
+
+def _drain(q: queue.Queue) -> list[Any]:
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def stream_pool_list(
+    incremental: bool = False,
+    end_page: int | None = None,
+    max_workers: int = MAX_WORKERS,
+    queue_size: int = 32,
+    checkpoint_path: Path = CHECKPOINT_PATH,
+) -> list[dict[str, Any]]:
+    """
+    流式获取完整的卡池列表, 结果与 crawl 相同
+
+    每个队列最多缓存 queue_size 个帖子, 内存占用与翻页数量无关
+    """
+    old_pool_list, known_post_ids = load_known_pools(incremental)
+    header = checkpoint_header(incremental, end_page)
+    records = load_checkpoint(checkpoint_path, header)
+    if records is None or not checkpoint_path.exists():
+        if records is None:
+            print("检查点由参数不同的运行写入, 重新开始")
+        records = []
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(checkpoint_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+    # pool.json 中已有的帖子不再从检查点加入
+    if known_post_ids:
+        records = [
+            (key, pool)
+            for key, pool in records
+            if get_post_id(pool["bbs"]) not in known_post_ids
+        ]
+    if records:
+        print(f"从检查点恢复 {len(records)} 个卡池")
+    # 同一帖子可能同时出现在两个关键词的搜索结果中, 按关键词分别记录
+    done_posts = {(key[0], get_post_id(pool["bbs"])) for key, pool in records}
+
+    catalog = get_catalog()
+    stages = _Stages()
+    post_queue: queue.Queue = queue.Queue(queue_size)
+    detail_queue: queue.Queue = queue.Queue(queue_size)
+    pool_queue: queue.Queue = queue.Queue(queue_size)
+    # 出错停止后, 已经获取但没能放入下一个队列的帖子详情和卡池
+    unsent_details: list[tuple[SortKey, dict, dict]] = []
+    unsent_pools: list[tuple[SortKey, dict]] = []
+
+    def search(keyword_index: int, keyword):
+        for page, posts in iter_search_pages(keyword, end_page, known_post_ids):
+            for index, post in enumerate(posts):
+                if (keyword_index, post["postId"]) in done_posts:
+                    continue
+                if not stages.put(post_queue, ((keyword_index, page, index), post)):
+                    return
+
+    def finish_search(search_threads: list[threading.Thread]):
+        for thread in search_threads:
+            thread.join()
+        for _ in range(max_workers):
+            stages.put(post_queue, _DONE)
+
+    def fetch_detail():
+        while (item := stages.get(post_queue)) is not _DONE:
+            key, post = item
+            detail = get_post_detail(post["postId"])
+            if not stages.put(detail_queue, (key, post, detail)):
+                unsent_details.append((key, post, detail))
+                return
+        stages.put(detail_queue, _DONE)
+
+    def parse():
+        remaining = max_workers
+        while remaining:
+            item = stages.get(detail_queue)
+            if item is _DONE:
+                if stages.stop.is_set():
+                    return
+                remaining -= 1
+                continue
+            key, post, detail = item
+            pool = parse_pool(post, detail, catalog)
+            if not stages.put(pool_queue, (key, pool)):
+                unsent_pools.append((key, pool))
+                return
+        stages.put(pool_queue, _DONE)
+
+    search_threads = [
+        stages.start(search, keyword_index, keyword)
+        for keyword_index, keyword in enumerate(KEYWORDS)
+    ]
+    stages.start(finish_search, search_threads)
+    for _ in range(max_workers):
+        stages.start(fetch_detail)
+    stages.start(parse)
+
+    def write(f, key: SortKey, pool: dict):
+        f.write(json.dumps({"key": key, "pool": pool}, ensure_ascii=False))
+        f.write("\n")
+        f.flush()
+
+    with open(checkpoint_path, "a", encoding="utf-8") as f:
+        while True:
+            try:
+                item = pool_queue.get(timeout=0.1)
+            except queue.Empty:
+                if stages.stop.is_set():
+                    break
+                continue
+            if item is _DONE:
+                break
+            write(f, *item)
+
+        stages.join()
+        if stages.error is not None:
+            # 已经获取的结果先写入检查点再抛出异常, 下次运行不必重新获取
+            for queued in _drain(pool_queue):
+                if queued is not _DONE:
+                    unsent_pools.append(queued)
+            for queued in _drain(detail_queue):
+                if queued is not _DONE:
+                    unsent_details.append(queued)
+            for key, post, detail in unsent_details:
+                try:
+                    unsent_pools.append((key, parse_pool(post, detail, catalog)))
+                except Exception:
+                    continue
+            for key, pool in unsent_pools:
+                write(f, key, pool)
+            raise stages.error
+
+    records = sorted(load_checkpoint(checkpoint_path), key=lambda record: record[0])
+    # 检查点中可能有 pool.json 已有的卡池
+    old_keys = {pool_key(pool) for pool in old_pool_list}
+    new_pool_list = [pool for _, pool in records if pool_key(pool) not in old_keys]
+    pool_list = FIXED_POOL_LIST + old_pool_list + new_pool_list
+    return sort_pool_list(pool_list)
+
+
+def clear_checkpoint(checkpoint_path: Path = CHECKPOINT_PATH):
+    """卡池列表保存后删除检查点"""
+    checkpoint_path.unlink(missing_ok=True)
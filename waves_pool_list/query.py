@@ -0,0 +1,145 @@
+"""
+卡池时间线查询
+
+    index = PoolIndex.load()
+    index.active_at("2025-01-01 12:00:00")     # 某一时刻开放的卡池
+    index.overlapping("2025-01-01", "2025-02-01")  # 与时间段有交集的卡池
+    index.by_item("1404")                      # 包含某个角色或武器的卡池
+"""
+
+import bisect
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from .config import POOL_LIST_PATH
+from .storage import load_pool_list
+from .timeline import TimeLike, pool_intervals, to_timestamp
+
+
+class PoolIndex:
+    """
+    卡池列表的只读索引
+
+    时间索引把时间轴按所有卡池的开始/结束时间切成若干段, 每段记录其中开放的卡池,
+    时间点查询只需一次二分; 角色/武器 id 和卡池类型使用倒排索引.
+    时间段和角色/武器索引另外按卡池类型各建一份, 指定类型的查询同样不需要扫描.
+    所有查询结果按开始时间排序, 返回原始的卡池字典.
+    """
+
+    def __init__(self, pool_list: list[dict[str, Any]]):
+        intervals = pool_intervals(pool_list)
+        order = sorted(range(len(pool_list)), key=lambda i: intervals[i])
+        self.pool_list = [pool_list[i] for i in order]
+        self.intervals = [intervals[i] for i in order]
+
+        # 时间段 [bounds[i], bounds[i + 1]) 内开放的卡池为 segments[i]
+        bounds = sorted(
+            {start for start, _ in self.intervals}
+            | {end + 1 for _, end in self.intervals}
+        )
+        segments: list[list[int]] = [[] for _ in bounds]
+        for i, (start, end) in enumerate(self.intervals):
+            lo = bisect.bisect_left(bounds, start)
+            hi = bisect.bisect_left(bounds, end + 1)
+            for segment in segments[lo:hi]:
+                segment.append(i)
+        self.bounds = bounds
+        self.segments = segments
+
+        self.five_star_index: dict[str, list[int]] = defaultdict(list)
+        self.four_star_index: dict[str, list[int]] = defaultdict(list)
+        self.pool_type_index: dict[str, list[int]] = defaultdict(list)
+        for i, pool in enumerate(self.pool_list):
+            for item_id in pool["five_star_ids"]:
+                self.five_star_index[item_id].append(i)
+            for item_id in pool["four_star_ids"]:
+                self.four_star_index[item_id].append(i)
+            self.pool_type_index[pool["pool_type"]].append(i)
+
+        # 每种卡池类型单独的时间段和倒排索引, 按类型查询时不需要再筛选
+        self.type_segments: dict[str, list[list[int]]] = {}
+        for pool_type in self.pool_type_index:
+            self.type_segments[pool_type] = [
+                [i for i in segment if self.pool_list[i]["pool_type"] == pool_type]
+                for segment in segments
+            ]
+        self.type_five_star_index: dict[tuple[str, str], list[int]] = defaultdict(list)
+        self.type_four_star_index: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for index, type_index in (
+            (self.five_star_index, self.type_five_star_index),
+            (self.four_star_index, self.type_four_star_index),
+        ):
+            for item_id, indices in index.items():
+                for i in indices:
+                    type_index[item_id, self.pool_list[i]["pool_type"]].append(i)
+
+    @classmethod
+    def load(cls, path: Path = POOL_LIST_PATH) -> "PoolIndex":
+        return cls(load_pool_list(path))
+
+    def __len__(self) -> int:
+        return len(self.pool_list)
+
+    def _select(self, indices: list[int] | set[int]) -> list[dict[str, Any]]:
+        return [self.pool_list[i] for i in sorted(indices)]
+
+    def _segments(self, pool_type: str | None) -> list[list[int]]:
+        if pool_type is None:
+            return self.segments
+        return self.type_segments.get(pool_type, [])
+
+    def _five_star(self, item_id: str, pool_type: str | None) -> list[int]:
+        if pool_type is None:
+            return self.five_star_index.get(item_id, [])
+        return self.type_five_star_index.get((item_id, pool_type), [])
+
+    def _four_star(self, item_id: str, pool_type: str | None) -> list[int]:
+        if pool_type is None:
+            return self.four_star_index.get(item_id, [])
+        return self.type_four_star_index.get((item_id, pool_type), [])
+
+    def active_at(
+        self, when: TimeLike, pool_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """某一时刻开放的卡池"""
+        i = bisect.bisect_right(self.bounds, to_timestamp(when)) - 1
+        segments = self._segments(pool_type)
+        if i < 0 or not segments:
+            return []
+        return self._select(segments[i])
+
+    def overlapping(
+        self, start: TimeLike, end: TimeLike, pool_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """与 [start, end] 有交集的卡池"""
+        start, end = to_timestamp(start), to_timestamp(end)
+        lo = max(bisect.bisect_right(self.bounds, start) - 1, 0)
+        hi = bisect.bisect_right(self.bounds, end)
+        indices = set()
+        for segment in self._segments(pool_type)[lo:hi]:
+            indices.update(segment)
+        return self._select(indices)
+
+    def by_five_star(
+        self, item_id: str, pool_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """5 星 UP 中包含 item_id 的卡池, 即该角色或武器的首次登场和复刻"""
+        return self._select(self._five_star(item_id, pool_type))
+
+    def by_four_star(
+        self, item_id: str, pool_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """4 星 UP 中包含 item_id 的卡池"""
+        return self._select(self._four_star(item_id, pool_type))
+
+    def by_item(
+        self, item_id: str, pool_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """5 星或 4 星 UP 中包含 item_id 的卡池"""
+        indices = set(self._five_star(item_id, pool_type))
+        indices.update(self._four_star(item_id, pool_type))
+        return self._select(indices)
+
+    def by_pool_type(self, pool_type: str) -> list[dict[str, Any]]:
+        return self._select(self.pool_type_index.get(pool_type, []))
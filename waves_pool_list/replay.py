@@ -0,0 +1,138 @@
+"""
+录制和回放 HTTP 请求
+
+RecordingAdapter 把真实响应保存为 fixture 文件, ReplayAdapter 从 fixture 返回响应,
+并可以注入延迟模拟真实接口, 用于离线复现问题和基准测试:
+
+    session = create_session()
+    use_adapter(session, ReplayAdapter(load_fixtures(path), latency=0.05))
+    set_session(session)
+"""
+
+import hashlib
+import json
+import random
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class Fixture(BaseModel):
+    method: str
+    url: str
+    body: str = ""
+    status_code: int = 200
+    headers: dict[str, str] = {}
+    content: str
+
+
+def request_key(method: str, url: str, body: str | bytes | None = None) -> str:
+    """请求的唯一标识, 表单参数排序后参与计算, 与编码顺序无关"""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8")
+    params = sorted(parse_qsl(body or "", keep_blank_values=True))
+    raw = json.dumps([method.upper(), url, params], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def fixture_key(fixture: Fixture) -> str:
+    return request_key(fixture.method, fixture.url, fixture.body)
+
+
+def load_fixtures(path: Path) -> dict[str, Fixture]:
+    fixtures = {}
+    for fixture_path in sorted(path.glob("*.json")):
+        fixture = Fixture.model_validate_json(fixture_path.read_text(encoding="utf-8"))
+        fixtures[fixture_key(fixture)] = fixture
+    return fixtures
+
+
+def save_fixture(path: Path, fixture: Fixture):
+    path.mkdir(parents=True, exist_ok=True)
+    fixture_path = path / f"{fixture_key(fixture)}.json"
+    fixture_path.write_text(fixture.model_dump_json(indent=2), encoding="utf-8")
+
+
+def use_adapter(session: requests.Session, adapter: BaseAdapter):
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """正常发送请求, 并把响应保存到 path 目录"""
+
+    def __init__(self, path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        fixture = Fixture(
+            method=request.method or "GET",
+            url=request.url or "",
+            body=_body_text(request.body),
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content.decode("utf-8"),
+        )
+        save_fixture(self.path, fixture)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    从 fixture 返回响应, 不访问网络
+
+    每个请求等待 latency 秒, 再加上 0 ~ jitter 秒的随机延迟
+    """
+
+    def __init__(
+        self,
+        fixtures: dict[str, Fixture],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+    ):
+        super().__init__()
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method or "GET", request.url or "", request.body)
+        fixture = self.fixtures.get(key)
+        if fixture is None:
+            raise requests.ConnectionError(
+                f"没有录制的请求: {request.method} {request.url} {request.body}",
+                request=request,
+            )
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = fixture.status_code
+        response.headers = CaseInsensitiveDict(fixture.headers)
+        # 录制时 requests 已经解压, 回放的内容不能再标记为压缩
+        response.headers.pop("Content-Encoding", None)
+        response._content = fixture.content.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _body_text(body: str | bytes | None) -> str:
+    if body is None:
+        return ""
+    if isinstance(body, bytes):
+        return body.decode("utf-8")
+    return body
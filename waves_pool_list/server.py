@@ -0,0 +1,264 @@
+"""
+本地 HTTP 服务
+
+卡池列表和角色/武器名称常驻内存, 响应预先压缩并带有 ETag, pool.json 更新后自动重新加载:
+
+    GET /pools                      完整卡池列表, 与 compressed_pool.json 相同
+    GET /pools/active?at=<时间>      某一时刻开放的卡池, 默认为当前时间
+    GET /pools/item/<id>            5 星或 4 星 UP 包含该角色或武器的卡池
+    GET /pools/type/<卡池类型>        某一类型的卡池
+    GET /catalog                    所有角色和武器的 id 到名称
+
+/pools 开头的接口都可以加上 pool_type 参数筛选卡池类型, 时间可以是时间戳或
+"2025-01-01 12:00:00" 格式的服务器时间.
+"""
+
+import bisect
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+from .config import POOL_LIST_PATH
+from .query import PoolIndex
+from .storage import load_pool_list
+from .timeline import to_timestamp
+
+# 每个数据集最多缓存的筛选结果数量
+RESPONSE_CACHE_SIZE = 1024
+# 检查 pool.json 是否更新的间隔 (秒)
+RELOAD_INTERVAL = 1.0
+
+
+class Response:
+    """预先编码和压缩的响应"""
+
+    def __init__(self, value: Any, status: HTTPStatus = HTTPStatus.OK):
+        self.status = status
+        self.body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        self.gzip_body = gzip.compress(self.body, mtime=0)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+
+NOT_FOUND = Response({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+
+def load_id2name(pool_list: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    所有角色和武器的 id 到名称
+
+    来自获取卡池时缓存的 hakush 数据, 服务中不请求网络. 每次加载 pool.json 时重新构建,
+    缓存不存在 (例如只用过 --no-cache) 时只有卡池中出现的角色和武器
+    """
+    # 角色和武器数据较大, 用到时再导入和构建
+    from .catalog import Catalog
+
+    id2name = {}
+    for pool in pool_list:
+        id2name.update(zip(pool["five_star_ids"], pool["five_star_names"]))
+        id2name.update(zip(pool["four_star_ids"], pool["four_star_names"]))
+    catalog = Catalog.load_cached()
+    if catalog is not None:
+        id2name.update(catalog.id2name)
+    return id2name
+
+
+def parse_time(value: str) -> int:
+    return int(value) if value.isdigit() else to_timestamp(value)
+
+
+class Dataset:
+    """某一版本的 pool.json 及其索引和响应缓存, 加载后不再修改"""
+
+    def __init__(self, pool_list: list[dict[str, Any]], id2name: dict[str, str]):
+        self.index = PoolIndex(pool_list)
+        self.pools = Response(pool_list)
+        self.catalog = Response(id2name)
+        self.cache: dict[str, Response] = {}
+        self.lock = threading.Lock()
+
+    def get(self, target: str) -> Response:
+        response = self.cache.get(target)
+        if response is None:
+            key, build, cache_target = self.route(target)
+            response = self.cache.get(key)
+            if response is None:
+                response = build()
+                self.store(key, response)
+            if cache_target:
+                self.store(target, response)
+        return response
+
+    def store(self, key: Any, response: Response):
+        with self.lock:
+            if len(self.cache) >= RESPONSE_CACHE_SIZE:
+                self.cache.clear()
+            self.cache[key] = response
+
+    def route(self, target: str) -> tuple[Any, Callable[[], Response], bool]:
+        """返回缓存的键、生成响应的函数, 以及能否按请求路径缓存"""
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip("/")
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        pool_type = params.get("pool_type")
+
+        if path == "/catalog":
+            return path, lambda: self.catalog, True
+        if path == "/pools" and pool_type is None:
+            return path, lambda: self.pools, True
+        if path == "/pools":
+            return (
+                ("type", pool_type),
+                lambda: Response(self.index.by_pool_type(pool_type)),
+                True,
+            )
+        if path == "/pools/active":
+            try:
+                when = parse_time(params["at"]) if "at" in params else int(time.time())
+            except ValueError as e:
+                error = Response({"error": str(e)}, HTTPStatus.BAD_REQUEST)
+                return target, lambda: error, True
+            # 同一时间段内开放的卡池相同, 按时间段缓存; 没有指定时间时不能按路径缓存
+            segment = bisect.bisect_right(self.index.bounds, when)
+            return (
+                ("active", segment, pool_type),
+                lambda: Response(self.index.active_at(when, pool_type)),
+                "at" in params,
+            )
+        if path.startswith("/pools/item/"):
+            item_id = path.removeprefix("/pools/item/")
+            return (
+                ("item", item_id, pool_type),
+                lambda: Response(self.index.by_item(item_id, pool_type)),
+                True,
+            )
+        if path.startswith("/pools/type/"):
+            pool_type = path.removeprefix("/pools/type/")
+            return self.route("/pools?" + urlencode({"pool_type": pool_type}))
+        return target, lambda: NOT_FOUND, True
+
+
+class DatasetLoader:
+    """pool.json 的修改时间或大小变化时重新加载, 请求中只读取当前的 Dataset"""
+
+    def __init__(self, path: Path = POOL_LIST_PATH):
+        self.path = path
+        self.version = None
+        self.dataset = self.load()
+
+    def stat(self):
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> Dataset:
+        self.version = self.stat()
+        pool_list = load_pool_list(self.path)
+        return Dataset(pool_list, load_id2name(pool_list))
+
+    def reload_if_changed(self) -> bool:
+        try:
+            if self.stat() == self.version:
+                return False
+            dataset = self.load()
+        except (OSError, ValueError) as e:
+            # 文件被替换的瞬间, 下次再试
+            print(f"重新加载失败: {e}")
+            return False
+        self.dataset = dataset
+        print(f"已重新加载 {self.path}: {len(dataset.index)} 个卡池")
+        return True
+
+    def watch(self, stop: threading.Event, interval: float = RELOAD_INTERVAL):
+        while not stop.wait(interval):
+            self.reload_if_changed()
+
+
+class PoolRequestHandler(BaseHTTPRequestHandler):
+    # 保持连接, 客户端可以复用同一个连接发送多个请求
+    protocol_version = "HTTP/1.1"
+    # 响应头和响应体分两次发送, 不关闭 Nagle 算法时每个请求都要等待对方的延迟确认
+    disable_nagle_algorithm = True
+    loader: DatasetLoader
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body: bool):
+        response = self.loader.dataset.get(self.path)
+        use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        etag = response.gzip_etag if use_gzip else response.etag
+
+        if response.status == HTTPStatus.OK and etag_matches(
+            self.headers.get("If-None-Match"), etag
+        ):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = response.gzip_body if use_gzip else response.body
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if response.status == HTTPStatus.OK:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        # 每个请求都写日志会明显降低吞吐量
+        pass
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    path: Path = POOL_LIST_PATH,
+) -> tuple[ThreadingHTTPServer, DatasetLoader]:
+    loader = DatasetLoader(path)
+    handler = type("Handler", (PoolRequestHandler,), {"loader": loader})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, loader
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, path: Path = POOL_LIST_PATH):
+    server, loader = create_server(host, port, path)
+    stop = threading.Event()
+    watcher = threading.Thread(target=loader.watch, args=(stop,), daemon=True)
+    watcher.start()
+    print(f"http://{host}:{server.server_address[1]}/pools")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
@@ -0,0 +1,88 @@
+"""
+按卡池类型和结束时间的年份拆分卡池列表
+
+每个分片是一个与 compressed_pool.json 格式相同的文件, manifest.json 的 shards 中记录
+每个分片的时间范围、数量和哈希, 使用方只需下载覆盖所需时间段的分片:
+
+    load_shards(MANIFEST_PATH, start="2025-01-01", pool_type="角色活动唤取")
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .timeline import SERVER_TIMEZONE, TimeLike, pool_intervals, to_timestamp
+
+SHARD_NAMES = {"角色活动唤取": "character", "武器活动唤取": "weapon"}
+
+
+def shard_name(pool_type: str, year: int) -> str:
+    return f"{SHARD_NAMES.get(pool_type, pool_type)}-{year}.json"
+
+
+def build_shards(pool_list: list[dict[str, Any]]) -> dict[str, tuple[dict, bytes]]:
+    """返回 {文件名: (manifest 中的记录, 文件内容)}, 分片内保持原来的顺序"""
+    groups: dict[str, list[tuple[dict[str, Any], int, int]]] = {}
+    for pool, (start, end) in zip(pool_list, pool_intervals(pool_list)):
+        year = datetime.fromtimestamp(end, SERVER_TIMEZONE).year
+        name = shard_name(pool["pool_type"], year)
+        groups.setdefault(name, []).append((pool, start, end))
+
+    shards = {}
+    for name, group in sorted(groups.items()):
+        pools = [pool for pool, _, _ in group]
+        content = json.dumps(pools, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        entry = {
+            "pool_type": pools[0]["pool_type"],
+            "year": datetime.fromtimestamp(group[0][2], SERVER_TIMEZONE).year,
+            "start_timestamp": min(start for _, start, _ in group),
+            "end_timestamp": max(end for _, _, end in group),
+            "count": len(pools),
+            "hash": "sha256:" + hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+        }
+        shards[name] = (entry, content)
+    return shards
+
+
+def select_shards(
+    manifest: dict[str, Any],
+    start: TimeLike | None = None,
+    end: TimeLike | None = None,
+    pool_type: str | None = None,
+) -> list[dict[str, Any]]:
+    """manifest 中与 [start, end] 有交集的分片记录"""
+    start = None if start is None else to_timestamp(start)
+    end = None if end is None else to_timestamp(end)
+    return [
+        entry
+        for entry in manifest.get("shards", [])
+        if (pool_type is None or entry["pool_type"] == pool_type)
+        and (start is None or entry["end_timestamp"] >= start)
+        and (end is None or entry["start_timestamp"] <= end)
+    ]
+
+
+def load_shards(
+    manifest_path: Path,
+    start: TimeLike | None = None,
+    end: TimeLike | None = None,
+    pool_type: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    读取与 [start, end] 有交集的分片, 按结束时间排序
+
+    分片按结束时间的年份划分, 结果中可能包含时间段之外的卡池
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    pool_list = []
+    for entry in select_shards(manifest, start, end, pool_type):
+        with open(manifest_path.parent / entry["file"], encoding="utf-8") as f:
+            pool_list.extend(json.load(f))
+    pool_list.sort(key=lambda pool: pool["end_timestamp"])
+    return pool_list
@@ -0,0 +1,247 @@
+"""
+抽卡模拟
+
+同时模拟大量互相独立的抽卡序列, 每一步用 NumPy 处理所有序列:
+
+    banners = timeline(load_pool_list(), "角色活动唤取", since="2025-01-01")
+    result = simulate(banners, income=80, savings=100)
+    result.summary()   # 每个卡池抽到 UP 5 星的概率和所需抽数的分位数
+
+    pulls_to_featured(1_000_000, "角色活动唤取")  # 从 0 抽开始抽到 UP 5 星的抽数
+
+保底抽数和是否必定为 UP 在同一类型的相邻卡池之间继承. 只模拟 5 星, 不区分常驻 5 星的种类.
+需要安装 numpy: uv sync --extra analytics 或 pip install numpy
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "抽卡模拟需要 numpy: uv sync --extra analytics 或 pip install numpy"
+    ) from e
+
+from .timeline import TimeLike, pool_intervals, to_timestamp
+
+UNLIMITED = np.iinfo(np.int64).max
+
+
+@dataclass(frozen=True)
+class PityRules:
+    """
+    5 星的出货概率
+
+    第 soft_pity 抽开始每抽概率增加 soft_pity_step, 第 hard_pity 抽必定为 5 星;
+    featured_rate 为 5 星是 UP 的概率, 没有抽到 UP 时下一个 5 星必定为 UP.
+    默认值为社区统计的近似值
+    """
+
+    base_rate: float = 0.008
+    soft_pity: int = 66
+    soft_pity_step: float = 0.04
+    hard_pity: int = 80
+    featured_rate: float = 0.5
+
+    @cached_property
+    def survival(self) -> np.ndarray:
+        """survival[k]: 连续 k 抽都不是 5 星的概率"""
+        pulls = np.arange(1, self.hard_pity + 1)
+        rate = self.base_rate + self.soft_pity_step * np.maximum(
+            pulls - self.soft_pity + 1, 0
+        )
+        rate = np.minimum(rate, 1.0)
+        rate[-1] = 1.0
+        return np.concatenate([[1.0], np.cumprod(1 - rate)])
+
+    def sample(self, pity: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """已经 pity 抽没有出 5 星时, 到下一个 5 星还需要的抽数"""
+        survival = self.survival
+        # 逆变换采样: 第一个满足 survival[k] <= survival[pity] * u 的 k
+        target = survival[pity] * rng.random(len(pity))
+        return np.searchsorted(-survival, -target) - pity
+
+
+RULES = {
+    "角色活动唤取": PityRules(),
+    # 武器活动唤取的 5 星必定为 UP 武器
+    "武器活动唤取": PityRules(featured_rate=1.0),
+}
+
+
+class PullState:
+    """每个序列的保底抽数和下一个 5 星是否必定为 UP"""
+
+    def __init__(self, n: int, pity: int = 0, guaranteed: bool = False):
+        self.pity = np.full(n, pity, dtype=np.int64)
+        self.guaranteed = np.full(n, guaranteed, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.pity)
+
+
+def pull(
+    state: PullState,
+    rules: PityRules,
+    rng: np.random.Generator,
+    budget: np.ndarray | None = None,
+    copies: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    每个序列一直抽到获得 copies 个 UP 5 星或用完 budget 抽, 更新 state
+
+    每轮直接采样到下一个 5 星的抽数, 循环次数只与 5 星的数量有关.
+    返回每个序列使用的抽数和获得的 UP 数量
+    """
+    n = len(state)
+    budget = np.full(n, UNLIMITED) if budget is None else budget
+    used = np.zeros(n, dtype=np.int64)
+    featured = np.zeros(n, dtype=np.int64)
+    active = np.flatnonzero(budget > 0)
+    while active.size:
+        need = rules.sample(state.pity[active], rng)
+        left = budget[active] - used[active]
+        hit = need <= left
+
+        # 用完剩余的抽数也没有出 5 星
+        miss = active[~hit]
+        state.pity[miss] += left[~hit]
+        used[miss] = budget[miss]
+
+        active = active[hit]
+        used[active] += need[hit]
+        state.pity[active] = 0
+        won = state.guaranteed[active] | (rng.random(active.size) < rules.featured_rate)
+        featured[active] += won
+        state.guaranteed[active] = ~won & (rules.featured_rate < 1)
+        active = active[(featured[active] < copies) & (used[active] < budget[active])]
+    return used, featured
+
+
+def pulls_to_featured(
+    n: int,
+    pool_type: str = "角色活动唤取",
+    pity: int = 0,
+    guaranteed: bool = False,
+    copies: int = 1,
+    seed: int | None = None,
+) -> np.ndarray:
+    """n 个序列从指定状态开始抽到 copies 个 UP 5 星所需的抽数"""
+    rng = np.random.default_rng(seed)
+    used, _ = pull(PullState(n, pity, guaranteed), RULES[pool_type], rng, copies=copies)
+    return used
+
+
+def timeline(
+    pool_list: list[dict[str, Any]],
+    pool_type: str,
+    since: TimeLike | None = None,
+    until: TimeLike | None = None,
+) -> list[dict[str, Any]]:
+    """
+    某一类型的卡池按开始时间排序, 可以按开始时间筛选
+
+    同时开放的多个卡池都会保留, 模拟时会依次抽取; 只想抽其中一个时需要自行筛选
+    """
+    since = None if since is None else to_timestamp(since)
+    until = None if until is None else to_timestamp(until)
+    banners = [
+        (start, pool)
+        for pool, (start, _) in zip(pool_list, pool_intervals(pool_list))
+        if pool["pool_type"] == pool_type
+        and (since is None or start >= since)
+        and (until is None or start <= until)
+    ]
+    banners.sort(key=lambda banner: banner[0])
+    return [pool for _, pool in banners]
+
+
+@dataclass
+class SimulationResult:
+    """
+    simulate 的结果
+
+    pulls[i, j] 为第 i 个序列在第 j 个卡池使用的抽数, featured[i, j] 为获得的 UP 数量
+    """
+
+    banners: list[dict[str, Any]]
+    pulls: np.ndarray
+    featured: np.ndarray
+    copies: int
+
+    @property
+    def obtained(self) -> np.ndarray:
+        return self.featured >= self.copies
+
+    def success_rate(self) -> np.ndarray:
+        """每个卡池获得 copies 个 UP 的比例"""
+        return self.obtained.mean(axis=0)
+
+    def percentiles(self, q=(50, 90, 99)) -> np.ndarray:
+        """每个卡池中获得 UP 的序列所用抽数的分位数, 形状为 (卡池数, len(q))"""
+        result = np.full((len(self.banners), len(q)), np.nan)
+        for j in range(len(self.banners)):
+            pulls = self.pulls[self.obtained[:, j], j]
+            if pulls.size:
+                result[j] = np.percentile(pulls, q)
+        return result
+
+    def distribution(self, banner: int) -> np.ndarray:
+        """第 banner 个卡池中获得 UP 的序列所用抽数的分布, 下标为抽数"""
+        pulls = self.pulls[self.obtained[:, banner], banner]
+        return np.bincount(pulls) / len(self.pulls)
+
+    def summary(self, q=(50, 90, 99)) -> list[dict[str, Any]]:
+        percentiles = self.percentiles(q)
+        return [
+            {
+                "title": pool["title"],
+                "five_star_names": pool["five_star_names"],
+                "success_rate": float(rate),
+                **{f"p{p}": float(value) for p, value in zip(q, row)},
+            }
+            for pool, rate, row in zip(self.banners, self.success_rate(), percentiles)
+        ]
+
+
+def simulate(
+    banners: list[dict[str, Any]],
+    n: int = 100_000,
+    income: int | list[int] | None = None,
+    savings: int = 0,
+    copies: int = 1,
+    pity: int = 0,
+    guaranteed: bool = False,
+    seed: int | None = None,
+) -> SimulationResult:
+    """
+    依次在 banners 中抽取, 每个卡池抽到 copies 个 UP 5 星后停止
+
+    income 为每个卡池开始前新增的抽数 (可以为每个卡池分别指定), 没有用完的抽数留到之后;
+    income 为 None 时不限制抽数. banners 应为同一类型的卡池, 保底在卡池之间继承
+    """
+    if not banners:
+        raise ValueError("没有卡池")
+    rules = RULES[banners[0]["pool_type"]]
+    rng = np.random.default_rng(seed)
+    state = PullState(n, pity, guaranteed)
+    if isinstance(income, int):
+        income = [income] * len(banners)
+    if income is not None and len(income) != len(banners):
+        raise ValueError("income 的数量与卡池数量不同")
+
+    pulls = np.zeros((n, len(banners)), dtype=np.int32)
+    featured = np.zeros((n, len(banners)), dtype=np.int16)
+    balance = np.full(n, savings, dtype=np.int64)
+    for j in range(len(banners)):
+        if income is None:
+            used, got = pull(state, rules, rng, copies=copies)
+        else:
+            balance += income[j]
+            used, got = pull(state, rules, rng, balance, copies)
+            balance -= used
+        pulls[:, j] = used
+        featured[:, j] = got
+    return SimulationResult(banners, pulls, featured, copies)
@@ -0,0 +1,152 @@
+"""
+读写卡池列表文件
+
+卡池列表没有变化时不写入文件, 变化时先写临时文件再替换, 避免留下写了一半的文件.
+manifest.json 记录卡池列表的哈希, 使用方可以先比较哈希再决定是否下载;
+变化的卡池同时追加到 changelog.jsonl, 见 changelog.py; 按卡池类型和年份拆分的分片
+写入 shards 目录, 见 shards.py.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .changelog import append_changes, diff_pool_lists
+from .config import (
+    CHANGELOG_PATH,
+    COMPRESSED_POOL_LIST_PATH,
+    MANIFEST_PATH,
+    POOL_LIST_PATH,
+    SHARD_DIR,
+)
+from .metrics import metrics
+from .shards import build_shards
+
+
+def load_pool_list(path: Path = POOL_LIST_PATH) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pool_list_hash(pool_list: list[dict[str, Any]]) -> str:
+    """卡池列表规范化 (键排序、无空白) 后的 sha256"""
+    canonical = json.dumps(
+        pool_list, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def write_atomic(path: Path, content: str | bytes):
+    """写入同目录下的临时文件后替换, 读取方只会看到旧文件或完整的新文件"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+@metrics.stage("write")
+def save_pool_list(
+    pool_list: list[dict[str, Any]],
+    path: Path = POOL_LIST_PATH,
+    compressed_path: Path = COMPRESSED_POOL_LIST_PATH,
+    manifest_path: Path = MANIFEST_PATH,
+    changelog_path: Path = CHANGELOG_PATH,
+    shard_dir: Path | None = SHARD_DIR,
+) -> bool:
+    """
+    写入卡池列表、变更记录、分片和 manifest, 哈希与 manifest 中相同时跳过, 返回是否写入
+
+    变更记录最先写入: 中途失败时下次运行会重复记录同样的变更, 但不会漏掉.
+    shard_dir 不为 None 时写入分片, 见 shards.py
+    """
+    digest = pool_list_hash(pool_list)
+    manifest = load_manifest(manifest_path)
+    paths = [path, compressed_path]
+    paths += [
+        manifest_path.parent / entry["file"] for entry in manifest.get("shards", [])
+    ]
+    if manifest.get("hash") == digest and all(p.exists() for p in paths):
+        return False
+
+    # 所有文件内容先生成好, 生成失败时不会留下只写了一部分的输出
+    files = {
+        path: json.dumps(pool_list, indent=4, ensure_ascii=False),
+        compressed_path: json.dumps(
+            pool_list, ensure_ascii=False, separators=(",", ":")
+        ),
+    }
+    shard_contents = {} if shard_dir is None else build_shards(pool_list)
+
+    changes = diff_pool_lists(load_pool_list(path), pool_list)
+    seq, changelog_size = append_changes(changes, changelog_path)
+
+    for file_path, content in files.items():
+        write_atomic(file_path, content)
+    shards = (
+        []
+        if shard_dir is None
+        else save_shards(shard_contents, shard_dir, manifest_path, manifest)
+    )
+
+    manifest = {
+        "hash": digest,
+        "count": len(pool_list),
+        "updated_at": int(time.time()),
+        "files": {
+            file_path.name: {"size": file_path.stat().st_size} for file_path in files
+        },
+        "changelog": {"seq": seq, "size": changelog_size},
+        "shards": shards,
+    }
+    # manifest 最后写入, 使用方看到新的哈希时文件已经是新的
+    write_atomic(manifest_path, json.dumps(manifest, indent=4, ensure_ascii=False))
+    return True
+
+
+def save_shards(
+    shard_contents: dict[str, tuple[dict[str, Any], bytes]],
+    shard_dir: Path,
+    manifest_path: Path,
+    old_manifest: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    写入 build_shards 生成的分片, 返回 manifest 中的分片记录
+
+    只写入哈希变化的分片, 删除不再存在的分片
+    """
+    old_entries = {entry["file"]: entry for entry in old_manifest.get("shards", [])}
+    entries = []
+    for name, (entry, content) in shard_contents.items():
+        shard_path = shard_dir / name
+        file = Path(os.path.relpath(shard_path, manifest_path.parent)).as_posix()
+        old_entry = old_entries.pop(file, None)
+        if (
+            old_entry is None
+            or old_entry["hash"] != entry["hash"]
+            or not shard_path.exists()
+        ):
+            write_atomic(shard_path, content)
+        entries.append({"file": file, **entry})
+    for file in old_entries:
+        (manifest_path.parent / file).unlink(missing_ok=True)
+    return entries
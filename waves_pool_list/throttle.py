@@ -0,0 +1,325 @@
+"""
+请求限流、重试和合并
+
+ThrottledAdapter 包装 Session 的 adapter, 对指定域名的请求:
+
+- 令牌桶限制每秒请求数, 429 的 Retry-After 期间暂停发放令牌
+- AIMD 调整令牌桶速率和并发数: 请求成功时缓慢增加 (不超过上限),
+  429/5xx/连接错误时减半, 延迟明显高于基线时小幅减少
+
+只有实际发出的网络请求经过这里, 命中本地缓存的请求不受限制.
+重试只在 call_with_retry 中进行 (429/5xx/连接错误和接口返回的错误码),
+adapter 本身不重试, 避免两层重试的次数相乘.
+SingleFlight 合并同一时间对同一资源的重复请求.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, TypeVar
+from urllib.parse import urlsplit
+
+from .config import (
+    KUROBBS_API_HOST,
+    KUROBBS_BURST,
+    KUROBBS_MAX_CONCURRENCY,
+    KUROBBS_MAX_RATE,
+    KUROBBS_RATE_LIMIT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF,
+    RETRY_MAX_BACKOFF,
+)
+from .metrics import metrics
+
+if TYPE_CHECKING:
+    from requests.adapters import BaseAdapter
+
+T = TypeVar("T")
+
+# 可以重试的状态码, 同时表示接口过载
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(
+    attempt: int, base: float = RETRY_BACKOFF, maximum: float = RETRY_MAX_BACKOFF
+) -> float:
+    """第 attempt 次重试前的等待时间, 在 [0, base * 2^attempt] 中随机选取 (full jitter)"""
+    return random.uniform(0, min(maximum, base * 2**attempt))
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Retry-After 响应头 (秒数或 HTTP 日期) 对应的等待秒数"""
+    value = headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    # email.utils 导入较慢, 只有 HTTP 日期格式时才需要
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    每秒补充 rate 个令牌, 最多积累 burst 个; 令牌不足时预约之后的令牌并等待
+
+    接口过载时 rate 减半 (一秒内最多一次), 每个成功的请求使 rate 增加 1 / rate
+    (每秒约增加 1), 不超过 maximum_rate, 以便找到接口实际允许的速率
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        maximum_rate: float | None = None,
+        minimum_rate: float = 1,
+    ):
+        self.rate = rate
+        self.maximum_rate = rate if maximum_rate is None else maximum_rate
+        self.minimum_rate = minimum_rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.slowed_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.paused_until - now)
+        if wait > 0:
+            time.sleep(wait)
+
+    def slow_down(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self.slowed_at >= 1:
+                self.slowed_at = now
+                self.rate = max(self.minimum_rate, self.rate / 2)
+
+    def speed_up(self):
+        with self._lock:
+            self.rate = min(self.maximum_rate, self.rate + 1 / self.rate)
+
+    def pause(self, seconds: float):
+        """seconds 秒内不再发放令牌"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD 调整的并发上限
+
+    每个成功的请求使上限增加 1 / 上限 (每轮约增加 1); 过载时乘以 decrease,
+    延迟超过基线的 latency_tolerance 倍时乘以 slow_decrease.
+    基线为观察到的最低延迟, 并缓慢向当前延迟靠拢, 适应接口整体变慢的情况.
+    同一时刻发出的请求往往同时失败, 一个基线延迟内最多减少一次
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        minimum: float = 1,
+        decrease: float = 0.5,
+        slow_decrease: float = 0.9,
+        latency_tolerance: float = 2.0,
+    ):
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.minimum = minimum
+        self.decrease = decrease
+        self.slow_decrease = slow_decrease
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.baseline: float | None = None
+        self.decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float | None, overloaded: bool):
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self._decrease(self.decrease)
+            elif latency is not None:
+                if self.baseline is None or latency < self.baseline:
+                    self.baseline = latency
+                else:
+                    self.baseline += (latency - self.baseline) * 0.01
+                if latency > self.baseline * self.latency_tolerance:
+                    self._decrease(self.slow_decrease)
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _decrease(self, factor: float):
+        now = time.monotonic()
+        if now - self.decreased_at < (self.baseline or 0):
+            return
+        self.decreased_at = now
+        self.limit = max(self.minimum, self.limit * factor)
+
+
+class RateController:
+    """同一域名的令牌桶和并发上限, 进程内共享"""
+
+    def __init__(
+        self,
+        rate: float = KUROBBS_RATE_LIMIT,
+        burst: int = KUROBBS_BURST,
+        max_concurrency: int = KUROBBS_MAX_CONCURRENCY,
+        initial_concurrency: int = 2,
+        max_rate: float = KUROBBS_MAX_RATE,
+    ):
+        self.bucket = TokenBucket(rate, burst, max(rate, max_rate))
+        self.concurrency = AdaptiveConcurrency(initial_concurrency, max_concurrency)
+
+
+_controllers: dict[str, RateController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_rate_controller(host: str = KUROBBS_API_HOST) -> RateController:
+    with _controllers_lock:
+        controller = _controllers.get(host)
+        if controller is None:
+            controller = _controllers[host] = RateController()
+        return controller
+
+
+def set_rate_controller(host: str, controller: RateController):
+    """替换某个域名共享的 RateController, 例如调整速率或在测试中重新开始"""
+    with _controllers_lock:
+        _controllers[host] = controller
+
+
+class ThrottledAdapter:
+    """
+    发往 hosts 中域名的请求经过限流, 其他请求直接交给 adapter
+
+    429/5xx/连接错误时降低速率和并发数并原样返回 (或抛出), 由调用方决定是否重试.
+    实现了 Session 用到的 send 和 close, 不继承 BaseAdapter, 导入时不需要导入 requests
+    """
+
+    def __init__(
+        self,
+        adapter: "BaseAdapter",
+        hosts: tuple[str, ...] = (KUROBBS_API_HOST,),
+    ):
+        self.adapter = adapter
+        self.hosts = hosts
+
+    def send(self, request, **kwargs):
+        from requests.exceptions import ConnectionError, Timeout
+
+        host = urlsplit(request.url).hostname
+        if host not in self.hosts:
+            return self.adapter.send(request, **kwargs)
+        controller = get_rate_controller(host)
+
+        controller.bucket.acquire()
+        controller.concurrency.acquire()
+        start = time.monotonic()
+        try:
+            response = self.adapter.send(request, **kwargs)
+        except (ConnectionError, Timeout):
+            controller.concurrency.release(None, overloaded=True)
+            controller.bucket.slow_down()
+            raise
+        except BaseException:
+            controller.concurrency.release(None, overloaded=False)
+            raise
+        overloaded = response.status_code in RETRY_STATUS
+        controller.concurrency.release(time.monotonic() - start, overloaded)
+        if overloaded:
+            controller.bucket.slow_down()
+            retry_after = retry_after_seconds(response.headers)
+            if retry_after is not None:
+                controller.bucket.pause(retry_after)
+        else:
+            controller.bucket.speed_up()
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    url: str,
+    retry_value: Callable[[T], bool] | None = None,
+    retries: int = RETRY_ATTEMPTS,
+) -> T:
+    """
+    调用 func, 连接错误、超时、429/5xx 响应 (raise_for_status 抛出的 HTTPError)
+    和 retry_value 为真的返回值按指数退避重试, 等待时间不少于 Retry-After.
+    重试次数用完后抛出最后的异常或返回最后的结果
+    """
+    from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+    for attempt in range(retries):
+        try:
+            value = func()
+        except (ConnectionError, Timeout):
+            delay = backoff_delay(attempt)
+        except HTTPError as e:
+            response = e.response
+            if response is None or response.status_code not in RETRY_STATUS:
+                raise
+            delay = max(
+                backoff_delay(attempt), retry_after_seconds(response.headers) or 0
+            )
+        else:
+            if retry_value is None or not retry_value(value):
+                return value
+            delay = backoff_delay(attempt)
+        metrics.record_retry(url)
+        time.sleep(delay)
+    return func()
+
+
+class SingleFlight:
+    """同一个 key 同时只执行一次 func, 其他调用方等待并得到相同的结果或异常"""
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,104 @@
+"""
+卡池时间的解析和统一
+
+每个卡池除了用于显示的 start_time / end_time 字符串, 还保存对应的秒级时间戳
+start_timestamp / end_timestamp, 使用方可以直接比较和排序, 不需要再解析字符串.
+"""
+
+import bisect
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from .parser import VERSION_START_TIME
+
+# 公告中的时间都是服务器时间 (UTC+8)
+SERVER_TIMEZONE = timezone(timedelta(hours=8))
+SERVER_OFFSET = int(SERVER_TIMEZONE.utcoffset(None).total_seconds())
+TIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+TIMESTAMP_KEYS = ("start_timestamp", "end_timestamp")
+
+TimeLike = str | int | float | datetime
+
+
+def to_timestamp(value: TimeLike) -> int:
+    """把时间字符串、datetime 或时间戳统一转换为秒级时间戳"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=SERVER_TIMEZONE)
+        return int(value.timestamp())
+    if isinstance(value, int | float):
+        return int(value)
+    for fmt in TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return int(parsed.replace(tzinfo=SERVER_TIMEZONE).timestamp())
+    raise ValueError(f"无法解析时间: {value}")
+
+
+def server_day(timestamp: int) -> int:
+    """时间戳在服务器时区中的日期 (1970-01-01 起的天数)"""
+    return (timestamp + SERVER_OFFSET) // 86400
+
+
+def resolve_intervals(pool_list: list[dict[str, Any]]) -> list[tuple[int, int]]:
+    """
+    计算每个卡池的 [开始, 结束] 时间戳
+
+    开始时间为 "版本更新时间" 的卡池:
+    1. 同一天 (服务器时间) 结束的其他卡池有明确开始时间时, 使用其中最早的开始时间
+       (同一版本的角色和武器卡池, 结束时间可能相差几分钟)
+    2. 否则从上一批卡池结束后开始, 即上一个版本的最后一批卡池
+
+    例如 3.0 版本的武器卡池从同一天结束的角色卡池得到开始时间:
+
+    >>> character = {"start_time": "2025-08-28 04:00:00", "end_time": "2025-09-17 09:59:59"}
+    >>> weapon = {"start_time": "版本更新时间", "end_time": "2025-09-17 10:00:59"}
+    >>> start, _ = resolve_intervals([character, weapon])[1]
+    >>> start == to_timestamp("2025-08-28 04:00:00")
+    True
+    """
+    ends = [to_timestamp(pool["end_time"]) for pool in pool_list]
+    starts: list[int | None] = []
+    known_starts: dict[int, int] = {}
+    for pool, end in zip(pool_list, ends):
+        if pool["start_time"] == VERSION_START_TIME:
+            starts.append(None)
+            continue
+        start = to_timestamp(pool["start_time"])
+        starts.append(start)
+        day = server_day(end)
+        known_starts[day] = min(start, known_starts.get(day, start))
+
+    sorted_ends = sorted(set(ends))
+    intervals = []
+    for start, end in zip(starts, ends):
+        if start is None:
+            start = known_starts.get(server_day(end))
+        if start is None:
+            i = bisect.bisect_left(sorted_ends, end)
+            # 没有上一批卡池时只知道结束时间
+            start = sorted_ends[i - 1] + 1 if i > 0 else end
+        intervals.append((start, end))
+    return intervals
+
+
+def pool_intervals(pool_list: list[dict[str, Any]]) -> list[tuple[int, int]]:
+    """读取卡池的时间戳, 旧数据没有时间戳时重新计算"""
+    if all("start_timestamp" in pool for pool in pool_list):
+        return [(pool["start_timestamp"], pool["end_timestamp"]) for pool in pool_list]
+    return resolve_intervals(pool_list)
+
+
+def add_timestamps(pool_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """返回带有 start_timestamp / end_timestamp 的卡池列表, 不修改原来的字典"""
+    intervals = resolve_intervals(pool_list)
+    return [
+        {**pool, "start_timestamp": start, "end_timestamp": end}
+        for pool, (start, end) in zip(pool_list, intervals)
+    ]
+
+
+def strip_timestamps(pool: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in pool.items() if key not in TIMESTAMP_KEYS}
@@ -0,0 +1,81 @@
+"""
+常驻进程, 定期检查是否有新的卡池公告
+
+每次只搜索每个关键词的第一页 (不使用缓存的结果), 出现官方账号发布的新帖子时才执行
+增量获取并写入文件. 会话和角色/武器数据在进程内复用; 接口出错或限流时等待时间翻倍,
+恢复后回到正常间隔.
+"""
+
+import random
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .catalog import get_catalog
+from .config import SEARCH_PAGE_SIZES, WATCH_INTERVAL, WATCH_MAX_BACKOFF
+from .crawler import filter_post_list, index_pool_list, search_page
+from .kurobbs import SEARCH_URL
+from .metrics import metrics
+from .storage import load_pool_list
+from .throttle import retry_after_seconds
+
+KEYWORDS = ("角色活动唤取", "武器活动唤取")
+
+
+def load_known_post_ids() -> set[str]:
+    return set(index_pool_list(load_pool_list()))
+
+
+def probe(known_post_ids: set[str]) -> list[dict[str, Any]]:
+    """搜索每个关键词的第一页, 返回 known_post_ids 中没有的卡池公告"""
+    new_posts = []
+    for keyword in KEYWORDS:
+        # 只需要第一页中最新的几个帖子, 使用最小的每页数量
+        res, _ = search_page(1, keyword, SEARCH_PAGE_SIZES[-1:], ttl=0)
+        posts = filter_post_list(res["data"]["post"]["postList"], keyword)
+        new_posts.extend(post for post in posts if post["postId"] not in known_post_ids)
+    return new_posts
+
+
+def retry_after(error: Exception) -> float | None:
+    """限流响应中的 Retry-After (秒)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    return retry_after_seconds(response.headers)
+
+
+def watch(
+    update: Callable[[], None],
+    interval: float = WATCH_INTERVAL,
+    max_backoff: float = WATCH_MAX_BACKOFF,
+    stop: threading.Event | None = None,
+):
+    """
+    每隔 interval 秒检查一次, 有新帖子时调用 update 获取并保存卡池列表
+
+    检查或 update 出错时等待时间翻倍 (最多 max_backoff), 成功后恢复
+    """
+    stop = stop or threading.Event()
+    # 提前下载角色和武器数据, 之后的检查和获取都复用
+    get_catalog()
+    known_post_ids = load_known_post_ids()
+    delay = interval
+    while not stop.is_set():
+        try:
+            new_posts = probe(known_post_ids)
+            if new_posts:
+                titles = ", ".join(post["postTitle"] for post in new_posts)
+                print(f"发现 {len(new_posts)} 个新帖子: {titles}")
+                # 新卡池可能包含新角色或武器, 绕过缓存有效期重新验证
+                get_catalog(refresh=True)
+                update()
+                known_post_ids = load_known_post_ids()
+            delay = interval
+        except Exception as e:
+            metrics.record_retry(SEARCH_URL)
+            delay = min(delay * 2, max_backoff)
+            delay = max(delay, retry_after(e) or 0)
+            print(f"检查失败, {delay:.0f} 秒后重试: {e}")
+        # 加入少量随机延迟, 避免多个进程同时请求
+        stop.wait(delay + random.uniform(0, delay * 0.05))